@@ -8,37 +8,84 @@ from homeassistant.components import bluetooth
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import device_registry as dr
 
-from .const import DOMAIN
+from .bonds import TermaMoaBlueBondStore
+from .const import (
+    CONF_ADAPTER_CONCURRENCY,
+    CONF_ENTRY_TYPE,
+    CONF_FLEET_POLLING,
+    DATA_BOND_STORE,
+    DATA_FLEET,
+    DATA_ROUTER,
+    DATA_STATE_STORE,
+    DATA_WARMUP,
+    DEFAULT_ADAPTER_CONCURRENCY,
+    DEFAULT_FLEET_POLLING,
+    DOMAIN,
+    ENTRY_TYPE_CONTROLLER,
+)
 from .coordinator import TermaMoaBlueCoordinator
+from .fleet import FleetPollScheduler
+from .routing import ConnectionRouter, HaScannerRegistry
+from .scheduler import CONNECTION_SCHEDULER
+from .state_store import TermaMoaBlueStateStore
+from .warmup import WarmupQueue
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.CLIMATE, Platform.SENSOR]
+CONTROLLER_PLATFORMS: list[Platform] = [Platform.CLIMATE]
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Terma MOA Blue from a config entry."""
+    if entry.data.get(CONF_ENTRY_TYPE) == ENTRY_TYPE_CONTROLLER:
+        # Thermostat controller: drives the radiator entries, no device of its own
+        await hass.config_entries.async_forward_entry_setups(
+            entry, CONTROLLER_PLATFORMS
+        )
+        entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+        return True
+
     address = entry.data["address"]
 
+    # A radiator that is not advertising (e.g. switched off) still gets its
+    # entities with the stored state; the coordinator picks the BLEDevice up
+    # from its advertisements once it is back
     ble_device = bluetooth.async_ble_device_from_address(
         hass, address.upper(), connectable=True
     )
     if not ble_device:
-        raise ConfigEntryNotReady(
-            f"Could not find Terma MOA Blue device with address {address}"
+        _LOGGER.info(
+            "Terma MOA Blue %s is not advertising, starting from its stored state",
+            address,
         )
 
-    coordinator = TermaMoaBlueCoordinator(hass, ble_device)
+    hass.data.setdefault(DOMAIN, {})
+    if (bond_store := hass.data[DOMAIN].get(DATA_BOND_STORE)) is None:
+        bond_store = hass.data[DOMAIN][DATA_BOND_STORE] = TermaMoaBlueBondStore(hass)
+        await bond_store.async_load()
+    if (state_store := hass.data[DOMAIN].get(DATA_STATE_STORE)) is None:
+        state_store = hass.data[DOMAIN][DATA_STATE_STORE] = TermaMoaBlueStateStore(
+            hass
+        )
+        await state_store.async_load()
 
-    try:
-        await coordinator.async_config_entry_first_refresh()
-    except Exception as err:
-        raise ConfigEntryNotReady(f"Unable to connect to device: {err}") from err
+    CONNECTION_SCHEDULER.set_limit(_adapter_concurrency(hass))
 
-    hass.data.setdefault(DOMAIN, {})
+    if (router := hass.data[DOMAIN].get(DATA_ROUTER)) is None:
+        router = hass.data[DOMAIN][DATA_ROUTER] = ConnectionRouter(
+            HaScannerRegistry(hass)
+        )
+
+    fleet: FleetPollScheduler | None = None
+    if entry.options.get(CONF_FLEET_POLLING, DEFAULT_FLEET_POLLING):
+        fleet = hass.data[DOMAIN].setdefault(DATA_FLEET, FleetPollScheduler(hass))
+
+    coordinator = TermaMoaBlueCoordinator(
+        hass, entry, ble_device, bond_store, fleet, state_store, router
+    )
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
     # Register device with manufacturer info
@@ -55,11 +102,56 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+
+    # Entities start from the last-known (stale) state; the first real read
+    # must not hold up startup, and is staggered with the other radiators
+    warmup: WarmupQueue = hass.data[DOMAIN].setdefault(DATA_WARMUP, WarmupQueue(hass))
+    entry.async_on_unload(warmup.async_add(coordinator))
+
     return True
 
 
+def _adapter_concurrency(hass: HomeAssistant) -> int:
+    """Return the integration-wide number of connections per adapter.
+
+    The options flow keeps the value the same on all radiator entries;
+    entries differing from before that are resolved to the largest value.
+    """
+    return max(
+        (
+            entry.options.get(CONF_ADAPTER_CONCURRENCY, DEFAULT_ADAPTER_CONCURRENCY)
+            for entry in hass.config_entries.async_entries(DOMAIN)
+            if entry.data.get(CONF_ENTRY_TYPE) != ENTRY_TYPE_CONTROLLER
+        ),
+        default=DEFAULT_ADAPTER_CONCURRENCY,
+    )
+
+
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the entry when options change.
+
+    A change of the shared adapter concurrency alone is applied to the
+    scheduler without reloading.
+    """
+    coordinator = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if isinstance(coordinator, TermaMoaBlueCoordinator):
+        old = {**coordinator.options, CONF_ADAPTER_CONCURRENCY: None}
+        new = {**entry.options, CONF_ADAPTER_CONCURRENCY: None}
+        if old == new:
+            coordinator.options = dict(entry.options)
+            CONNECTION_SCHEDULER.set_limit(_adapter_concurrency(hass))
+            return
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
+    if entry.data.get(CONF_ENTRY_TYPE) == ENTRY_TYPE_CONTROLLER:
+        return await hass.config_entries.async_unload_platforms(
+            entry, CONTROLLER_PLATFORMS
+        )
+
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         coordinator: TermaMoaBlueCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
         await coordinator.async_shutdown()
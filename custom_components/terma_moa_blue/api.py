@@ -1,43 +1,237 @@
-"""API for Terma MOA Blue integration - temporary connections with manual retry."""
+"""API for Terma MOA Blue integration - short-lived connections with manual retry."""
 from __future__ import annotations
 
 import asyncio
+from dataclasses import dataclass
 import logging
-import struct
-from typing import Callable
+import time
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Coroutine, Mapping
 
 from bleak import BleakClient
+from bleak.backends.device import BLEDevice
 from bleak.exc import BleakError
-from bleak_retry_connector import establish_connection
-from homeassistant.components.bluetooth import BluetoothServiceInfoBleak
+from bleak_retry_connector import BleakClientWithServiceCache, establish_connection
 
+from .codec import (
+    ElementTemperatureFrame,
+    HexBytes,
+    ModeFrame,
+    RoomTemperatureFrame,
+    raw_temperature,
+)
 from .const import (
     CHAR_ELEMENT_TEMP,
     CHAR_MODE,
     CHAR_ROOM_TEMP,
+    DEFAULT_SESSION_LINGER,
+    DEFAULT_WRITE_DEBOUNCE,
+    READ_TTL_ELEMENT,
+    READ_TTL_MODE,
+    READ_TTL_ROOM,
+    SHUTDOWN_TIMEOUT,
     OperatingMode,
+    OperationPriority,
+)
+from .metrics import DeviceMetrics
+from .retry import CircuitBreaker, CircuitState, RetryPolicy
+from .routing import NO_RSSI, ConnectionPath
+from .scheduler import (
+    CONNECTION_SCHEDULER,
+    AdapterScheduler,
+    DEFAULT_SOURCE,
+    SlotHandle,
+    adapter_source,
 )
 
+if TYPE_CHECKING:
+    from .bonds import TermaMoaBlueBondStore
+    from .routing import ConnectionRouter
+
 _LOGGER = logging.getLogger(__name__)
 
-# Global lock for serial BT operations - prevents concurrent connections from multiple devices
-# Solves the problem when two TermaMoaBlueDevice instances try to connect simultaneously → adapter overload
-BT_SERIAL_LOCK = asyncio.Lock()
+# Characteristics of the MOA Blue service, resolved to handles once per device
+CHARACTERISTICS = (CHAR_ROOM_TEMP, CHAR_ELEMENT_TEMP, CHAR_MODE)
+
+# Error fragments suggesting the cached GATT layout no longer matches the device
+GATT_LAYOUT_ERROR_MARKERS = ("not found", "invalid handle", "invalid attribute")
+
+# Error fragments reported by BlueZ / proxies when the bond is missing or broken
+AUTH_ERROR_MARKERS = ("authentication", "encryption", "notpermitted", "not permitted")
+
+# Error fragments of backends rejecting a GATT request while another is pending
+OVERLAP_ERROR_MARKERS = ("inprogress", "in progress", "busy")
+
+# Devices currently holding an idle (lingering) connection open
+_LINGERING: dict[str, TermaMoaBlueDevice] = {}
+
+
+async def _release_lingering_sessions(
+    requester: TermaMoaBlueDevice, scheduler: AdapterScheduler
+) -> None:
+    """Close idle sessions on the adapter so it has a free link for requester.
+
+    Must be called while holding a slot of the adapter's scheduler.
+    """
+    idle = [
+        device
+        for address, device in _LINGERING.items()
+        if address != requester.address
+        and device._session_path is not None
+        and device._session_path.source == scheduler.source
+    ]
+    excess = scheduler.active + len(idle) - scheduler.limit
+    for device in idle[: max(excess, 0)]:
+        _LOGGER.debug(
+            "Closing idle session of %s - adapter %s needed by %s",
+            device.address,
+            scheduler.source,
+            requester.address,
+        )
+        await device._close_session()
+
+
+def _temps_match(desired: float | None, observed: float | None) -> bool:
+    """Return True if a setpoint needs no write at the protocol resolution."""
+    if desired is None:
+        return True
+    return observed is not None and raw_temperature(desired) == raw_temperature(observed)
+
+
+def _modes_match(desired: OperatingMode, observed: OperatingMode) -> bool:
+    """Return True if the observed mode fulfils the desired one."""
+    if desired == observed:
+        return True
+    # Off is off, whether switched via HA or on the radiator
+    return desired == OperatingMode.OFF and observed == OperatingMode.OFF_MANUAL
+
+
+@dataclass(slots=True)
+class _QueuedWrite:
+    """Fields of an apply() queued or being written.
+
+    Until it starts writing, a newer request takes its fields over.
+    """
+
+    values: dict[str, Any]
+    task: asyncio.Task[None] | None = None
+    started: bool = False
+
+
+@dataclass(slots=True)
+class _QueuedRead:
+    """A poll queued or reading.
+
+    Until it starts reading, a more urgent operation of the device skips
+    it, rather than queueing behind it for the device lock.
+    """
+
+    priority: OperationPriority
+    task: asyncio.Task[None] | None = None
+    started: bool = False
+    skipped_for: asyncio.Task[None] | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class DeviceSnapshot:
+    """Immutable copy of the cached device state, shared with the entities."""
 
-# Connection settings
-MAX_CONNECT_ATTEMPTS = 5  # Increased from 3 to 5
-CONNECTION_TIMEOUT = 20.0  # Increased from 15 to 20 seconds
-RETRY_DELAY = 3.0  # Increased from 2 to 3 seconds between retries
+    current_room_temp: float | None
+    target_room_temp: float | None
+    current_element_temp: float | None
+    target_element_temp: float | None
+    mode: OperatingMode | None
+    stale: bool
+
+
+@dataclass(frozen=True)
+class DesiredState:
+    """Mode and setpoints requested from Home Assistant (None = no request)."""
+
+    mode: OperatingMode | None = None
+    room_temperature: float | None = None
+    element_temperature: float | None = None
+
+    @property
+    def is_empty(self) -> bool:
+        """Return True if no field is set."""
+        return (
+            self.mode is None
+            and self.room_temperature is None
+            and self.element_temperature is None
+        )
 
 
 class TermaMoaBlueDevice:
     """Representation of a Terma MOA Blue device."""
 
-    def __init__(self, ble_device: BluetoothServiceInfoBleak) -> None:
-        """Initialize the device."""
+    def __init__(
+        self,
+        ble_device: BLEDevice | None,
+        session_linger: float = DEFAULT_SESSION_LINGER,
+        bond_store: TermaMoaBlueBondStore | None = None,
+        retry_policy: RetryPolicy | None = None,
+        write_debounce: float = DEFAULT_WRITE_DEBOUNCE,
+        reapply_desired: bool = False,
+        pipeline_reads: bool = False,
+        router: ConnectionRouter | None = None,
+        address: str | None = None,
+    ) -> None:
+        """Initialize the device.
+
+        The BLEDevice may be None while the radiator has not been seen yet;
+        the address is then required and set_ble_device supplies the device.
+        """
         self._ble_device = ble_device
-        self.address = ble_device.address
+        self.address = ble_device.address if ble_device is not None else address
+        # Serializes operations on this device; the adapter slot comes on top
         self._lock = asyncio.Lock()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breaker = CircuitBreaker()
+        self.metrics = DeviceMetrics()
+
+        # Debounced setpoint writes, merged per characteristic
+        self.write_debounce = write_debounce
+        self._pending_setpoints: dict[str, float] = {}
+        self._pending_future: asyncio.Future[None] | None = None
+        self._debounce_handle: asyncio.TimerHandle | None = None
+        self.setpoint_writes_merged = 0
+
+        # Desired state, reconciled against the observed state
+        self.desired = DesiredState()
+        self.reapply_desired = reapply_desired
+        self.writes_avoided = 0
+
+        # Operations queued or in flight, cancelled on shutdown
+        self._operations: set[asyncio.Task[None]] = set()
+        # Disconnects and debounced flushes - awaited, not cancelled, on shutdown
+        self._background_tasks: set[asyncio.Task[None]] = set()
+        self._queued_writes: list[_QueuedWrite] = []  # queued or being written
+        self._queued_reads: list[_QueuedRead] = []  # queued or reading
+        self._closed = False
+        self.writes_superseded = 0
+
+        # Choice between adapters/proxies reaching the device, if several do
+        self._router = router
+
+        # Idle-linger session: connection kept open for follow-up operations
+        self.session_linger = session_linger
+        self._client: BleakClient | None = None
+        self._session_path: ConnectionPath | None = None
+        # Adapter of the connection the running operation uses
+        self._link_source: str | None = None
+        self._linger_handle: asyncio.TimerHandle | None = None
+
+        # Bond state - pair() is only called when the bond is not known
+        self._bond_store = bond_store
+        self.pair_attempts_performed = 0
+        self.pair_attempts_skipped = 0
+
+        # GATT handles of the characteristics, kept across connections
+        self._handles: dict[str, int] = {}
+        self._connect_started: float | None = None
+        self.connect_to_first_read: float | None = None
+        # Outcome of the last operation, persisted to order the warm-up
+        self.last_connect_ok: bool | None = None
         
         # Cached state
         self._current_room_temp: float | None = None
@@ -45,11 +239,77 @@ class TermaMoaBlueDevice:
         self._current_element_temp: float | None = None
         self._target_element_temp: float | None = None
         self._mode: OperatingMode | None = None
+        # False while the cache holds restored values not yet read from the device
+        self._state_fresh = False
+        # When each characteristic was last read, for the read planner
+        self._read_at: dict[str, float] = {}
+        self.reads_skipped = 0
+        # Concurrent reads on one connection, except via adapters rejecting them
+        self.pipeline_reads = pipeline_reads
+        self._serial_adapters: set[str] = set()
 
     @property
     def name(self) -> str:
         """Return device name."""
-        return self._ble_device.name or f"Terma ({self.address})"
+        if self._ble_device is not None and self._ble_device.name:
+            return self._ble_device.name
+        return f"Terma ({self.address})"
+
+    def set_ble_device(self, ble_device: BLEDevice) -> None:
+        """Use the latest BLEDevice (best path) for the next connection."""
+        self._ble_device = ble_device
+
+    @property
+    def stale(self) -> bool:
+        """Return True until the state has been read from the device."""
+        return not self._state_fresh
+
+    def snapshot(self) -> DeviceSnapshot:
+        """Return an immutable copy of the cached state."""
+        return DeviceSnapshot(
+            current_room_temp=self._current_room_temp,
+            target_room_temp=self._target_room_temp,
+            current_element_temp=self._current_element_temp,
+            target_element_temp=self._target_element_temp,
+            mode=self._mode,
+            stale=not self._state_fresh,
+        )
+
+    def state_as_dict(self) -> dict[str, Any]:
+        """Return the cached state for persisting."""
+        return {
+            "current_room_temp": self._current_room_temp,
+            "target_room_temp": self._target_room_temp,
+            "current_element_temp": self._current_element_temp,
+            "target_element_temp": self._target_element_temp,
+            "mode": self._mode.value if self._mode is not None else None,
+            "last_connect_ok": self.last_connect_ok,
+        }
+
+    def restore_state(self, state: Mapping[str, Any]) -> None:
+        """Fill the cache from a persisted state; it stays stale until read."""
+        self._current_room_temp = state.get("current_room_temp")
+        self._target_room_temp = state.get("target_room_temp")
+        self._current_element_temp = state.get("current_element_temp")
+        self._target_element_temp = state.get("target_element_temp")
+        try:
+            self._mode = OperatingMode(state["mode"])
+        except (KeyError, TypeError, ValueError):
+            self._mode = None
+        self.last_connect_ok = state.get("last_connect_ok")
+        self._state_fresh = False
+        self._read_at.clear()
+
+    @property
+    def adapter(self) -> str:
+        """Return the Bluetooth adapter or proxy used to reach the device."""
+        if self._ble_device is None:
+            return DEFAULT_SOURCE
+        return adapter_source(self._ble_device)
+
+    def _scheduler(self, source: str | None = None) -> AdapterScheduler:
+        """Return the connection scheduler of an adapter, the current one by default."""
+        return CONNECTION_SCHEDULER.for_source(source or self.adapter)
 
     @property
     def current_room_temp(self) -> float | None:
@@ -76,200 +336,913 @@ class TermaMoaBlueDevice:
         """Return current operating mode."""
         return self._mode
 
+    def _cancel_linger(self) -> None:
+        """Stop the idle timer of the current session."""
+        if self._linger_handle is not None:
+            self._linger_handle.cancel()
+            self._linger_handle = None
+
+    def _schedule_linger(self) -> None:
+        """Keep the session open for the idle window, then disconnect."""
+        self._cancel_linger()
+        _LINGERING[self.address] = self
+        self._linger_handle = asyncio.get_running_loop().call_later(
+            self.session_linger, self._linger_expired
+        )
+
+    def _linger_expired(self) -> None:
+        """Detach the idle session and disconnect it in an adapter slot."""
+        self._linger_handle = None
+        path = self._session_path
+        client = self._detach_session()
+        if client is None or path is None:
+            return
+
+        async def _disconnect() -> None:
+            async with self._scheduler(path.source).slot():
+                await self._disconnect_client(client)
+
+        _LOGGER.debug("Idle window expired for %s", self.address)
+        self._create_background_task(_disconnect())
+
+    def _detach_session(self) -> BleakClient | None:
+        """Forget the idle session and return its client."""
+        self._cancel_linger()
+        _LINGERING.pop(self.address, None)
+        client, self._client = self._client, None
+        self._session_path = None
+        return client
+
+    async def _close_session(self) -> None:
+        """Disconnect the idle session, if any."""
+        if (client := self._detach_session()) is not None:
+            await self._disconnect_client(client)
+
+    async def _disconnect_client(self, client: BleakClient) -> None:
+        """Disconnect a client, ignoring errors."""
+        try:
+            if client.is_connected:
+                await client.disconnect()
+                _LOGGER.debug("Disconnected from %s", self.address)
+        except Exception as disconnect_err:
+            _LOGGER.debug(
+                "Error during disconnect from %s: %s",
+                self.address,
+                disconnect_err,
+            )
+
+    async def disconnect(self) -> None:
+        """Close any open session to the device."""
+        await self._close_session()
+
+    async def shutdown(self) -> None:
+        """Cancel all operations of the device and close its connection.
+
+        Debounced setpoints not written yet fail, queued and running
+        operations are cancelled - which disconnects their client and
+        releases the device lock and adapter slot right away - and later
+        operations are refused. Takes at most SHUTDOWN_TIMEOUT, whatever
+        state the radiator's link is in.
+        """
+        self._closed = True
+        if self._debounce_handle is not None:
+            self._debounce_handle.cancel()
+            self._debounce_handle = None
+        self._pending_setpoints.clear()
+        future, self._pending_future = self._pending_future, None
+        if future is not None and not future.done():
+            future.set_exception(BleakError(f"{self.address} was shut down"))
+
+        operations = list(self._operations)
+        for task in operations:
+            task.cancel()
+        if operations:
+            _LOGGER.debug(
+                "Cancelled %d operation(s) of %s", len(operations), self.address
+            )
+        # Background tasks finish on their own once the operations are gone:
+        # a debounced flush hands the cancellation to its callers, an idle
+        # session disconnect completes
+        pending = [*operations, *self._background_tasks]
+        try:
+            async with asyncio.timeout(SHUTDOWN_TIMEOUT):
+                if pending:
+                    await asyncio.wait(pending)
+                await self._close_session()
+        except TimeoutError:
+            _LOGGER.warning(
+                "Timed out closing the connection to %s on shutdown", self.address
+            )
+
+    def _create_background_task(self, coro: Coroutine[Any, Any, None]) -> None:
+        """Run a task, keeping a reference to it until it is done."""
+        task = asyncio.get_running_loop().create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _run(
+        self,
+        operation: Callable[[BleakClient], Awaitable[None]],
+        priority: OperationPriority,
+        write: _QueuedWrite | None = None,
+        read: _QueuedRead | None = None,
+    ) -> None:
+        """Run an operation as a task of this device, cancelled on shutdown.
+
+        A write whose fields were all taken over by a newer request while it
+        was queued is cancelled and returns without writing anything. A read
+        skipped for a more urgent operation returns once that one is done,
+        or runs after all if that one failed.
+        """
+        try:
+            if self._closed:
+                raise BleakError(f"{self.address} was shut down")
+            task = asyncio.get_running_loop().create_task(
+                self._execute_with_connection(operation, priority)
+            )
+            self._operations.add(task)
+            task.add_done_callback(self._operations.discard)
+            if write is not None:
+                write.task = task
+            if read is not None:
+                read.task = task
+            self._skip_queued_reads(priority, task)
+            await task
+        except asyncio.CancelledError:
+            if not task.cancelled() or asyncio.current_task().cancelling():
+                raise  # the caller itself was cancelled
+            if write is not None and not write.values:
+                _LOGGER.debug(
+                    "Dropped write to %s, superseded by a newer request",
+                    self.address,
+                )
+                return
+            if read is not None and (skipped_for := read.skipped_for) is not None:
+                # The operation ahead reads back what it writes, so the
+                # state is as fresh as the poll would have made it
+                await asyncio.wait([skipped_for])
+                if not skipped_for.cancelled() and skipped_for.exception() is None:
+                    return
+                # It did not get through - poll after all
+                read.skipped_for = None
+                await self._run(operation, priority, read=read)
+                return
+            raise BleakError(f"Operation on {self.address} cancelled") from None
+        finally:
+            if write is not None and write in self._queued_writes:
+                self._queued_writes.remove(write)
+            if read is not None and read in self._queued_reads:
+                self._queued_reads.remove(read)
+
+    def _skip_queued_reads(
+        self, priority: OperationPriority, task: asyncio.Task[None]
+    ) -> None:
+        """Cancel less urgent reads of this device that have not started yet.
+
+        A queued read holds (or waits for) the device lock while it queues
+        for an adapter slot behind other devices' polls; a more urgent
+        operation waiting for that lock would not even enter the slot queue.
+        """
+        for read in self._queued_reads:
+            if (
+                read.started
+                or read.priority <= priority
+                or read.task is None
+                or read.task is task
+            ):
+                continue
+            _LOGGER.debug(
+                "Skipping queued poll of %s for a more urgent operation",
+                self.address,
+            )
+            read.skipped_for = task
+            read.task.cancel()
+
+    def _matches(self, field: str, value: Any) -> bool:
+        """Return True if the observed state already has a requested value."""
+        if field == "mode":
+            return self._mode == value
+        if field == "room_temperature":
+            return _temps_match(value, self._target_room_temp)
+        return _temps_match(value, self._target_element_temp)
+
+    def _write_pending(self, field: str) -> bool:
+        """Return True if a debounced, queued or running write sets a field."""
+        return field in self._pending_setpoints or any(
+            field in queued.values for queued in self._queued_writes
+        )
+
+    def _supersede_queued_writes(self, values: Mapping[str, Any]) -> None:
+        """Take fields of a new request away from older writes still queued.
+
+        Covers debounced setpoints as well; their callers still get the
+        result of the merged write, which then simply has less to write.
+        """
+        for field in values.keys() & self._pending_setpoints.keys():
+            del self._pending_setpoints[field]
+            self.writes_superseded += 1
+        for queued in self._queued_writes:
+            if queued.started:
+                continue
+            superseded = values.keys() & queued.values.keys()
+            if not superseded:
+                continue
+            for field in superseded:
+                del queued.values[field]
+            self.writes_superseded += len(superseded)
+            if not queued.values and queued.task is not None:
+                queued.task.cancel()
+
+    def _plan_paths(self) -> list[ConnectionPath]:
+        """Return the connection paths to try, best first.
+
+        An open idle session keeps its path. Must be called while holding
+        the device lock, so no other operation of the device changes them.
+        """
+        if self._client is not None and self._session_path is not None:
+            return [self._session_path]
+        if self._router is not None and (paths := self._router.plan(self.address)):
+            return paths
+        if (ble_device := self._ble_device) is None:
+            raise BleakError(f"{self.address} has not been seen by any adapter")
+        return [ConnectionPath(adapter_source(ble_device), ble_device, NO_RSSI)]
+
+    async def _connect(self, path: ConnectionPath, timeout: float) -> BleakClient:
+        """Return a connected client, reusing the idle session when possible."""
+        client = self._detach_session()
+        if client is not None and client.is_connected:
+            _LOGGER.debug("Reusing open session to %s", self.address)
+            return client
+
+        # Use bleak-retry-connector for reliable connection; the service
+        # cache skips GATT service discovery when reconnecting
+        self._connect_started = time.monotonic()
+        with self.metrics.connect.time():
+            client = await establish_connection(
+                BleakClientWithServiceCache,
+                path.ble_device,
+                self.address,
+                max_attempts=1,  # We handle retries ourselves
+                timeout=timeout,
+                use_services_cache=True,
+            )
+        self._resolve_handles(client)
+
+        # Try to pair unless the device is known to be bonded
+        if self._bond_store is not None and self._bond_store.is_bonded(self.address):
+            self.pair_attempts_skipped += 1
+            _LOGGER.debug("Pairing skipped for %s: already bonded", self.address)
+            return client
+
+        self.pair_attempts_performed += 1
+        try:
+            with self.metrics.pair.time():
+                await client.pair()
+            _LOGGER.debug("Pairing successful for %s", self.address)
+        except Exception as pair_err:
+            # Pairing might fail if already paired - that's OK
+            _LOGGER.debug("Pairing skipped for %s: %s", self.address, pair_err)
+
+        return client
+
+    def _resolve_handles(self, client: BleakClient) -> None:
+        """Look up characteristic handles once and keep them for reconnects."""
+        if len(self._handles) == len(CHARACTERISTICS):
+            return
+        for uuid in CHARACTERISTICS:
+            if (char := client.services.get_characteristic(uuid)) is not None:
+                self._handles[uuid] = char.handle
+        _LOGGER.debug("Resolved GATT handles for %s: %s", self.address, self._handles)
+
+    async def _invalidate_gatt_cache(self, client: BleakClient | None) -> None:
+        """Forget cached services and handles after a GATT layout error."""
+        _LOGGER.debug("Clearing GATT cache of %s", self.address)
+        self._handles.clear()
+        if isinstance(client, BleakClientWithServiceCache):
+            try:
+                await client.clear_cache()
+            except Exception as err:
+                _LOGGER.debug("Error clearing GATT cache of %s: %s", self.address, err)
+
+    def _char(self, uuid: str) -> int | str:
+        """Return the cached handle of a characteristic, or its UUID."""
+        return self._handles.get(uuid, uuid)
+
+    async def _read(self, client: BleakClient, uuid: str) -> bytearray:
+        """Read a characteristic by its cached handle."""
+        with self.metrics.read.time():
+            data = await client.read_gatt_char(self._char(uuid))
+        self._read_at[uuid] = time.monotonic()
+        if self._connect_started is not None:
+            self.connect_to_first_read = time.monotonic() - self._connect_started
+            self._connect_started = None
+            _LOGGER.debug(
+                "Connect to first read of %s took %.2fs",
+                self.address,
+                self.connect_to_first_read,
+            )
+        return data
+
+    async def _write(self, client: BleakClient, uuid: str, data: bytes) -> None:
+        """Write a characteristic by its cached handle."""
+        # Only sessions starting with a read count for connect-to-first-read
+        self._connect_started = None
+        with self.metrics.write.time():
+            await client.write_gatt_char(self._char(uuid), data)
+
+    def _set_bonded(self, bonded: bool) -> None:
+        """Record the bond state of this device, if a bond store is used."""
+        if self._bond_store is not None:
+            self._bond_store.async_set_bonded(self.address, bonded)
+
     async def _execute_with_connection(
-        self, operation: Callable[[BleakClient], None]
+        self,
+        operation: Callable[[BleakClient], Awaitable[None]],
+        priority: OperationPriority = OperationPriority.POLL,
     ) -> None:
-        """Execute an operation with a temporary BLE connection and retry logic.
+        """Execute an operation with a BLE connection and retry logic.
         
-        Uses GLOBAL BT_SERIAL_LOCK (not instance self._lock) to prevent concurrent 
-        connections from multiple devices overwhelming the Bluetooth adapter.
+        Takes a slot of the connection scheduler of the adapter that reaches
+        the device, so devices on different adapters/proxies run in parallel
+        while each adapter handles at most the integration-wide adapter
+        concurrency (CONNECTION_SCHEDULER.set_limit) of connections.
+
+        With a router, the adapter is chosen among all that reach the device
+        (free connection slots, last working path, RSSI). A failed attempt
+        moves on to the next-best adapter without back-off; the back-off
+        applies once all of them have failed.
+
+        When session_linger is set, the connection is kept open for that many
+        seconds after a successful operation and reused by the next operation
+        for this device. Idle sessions of other devices on the same adapter
+        are closed when their link is needed.
+
+        Queued operations are granted slots by priority: interactive writes
+        run before verification reads, which run before scheduled polls.
+        Between retry attempts the slot is lent to any more urgent operation.
+        A poll of this device not reading yet is skipped for a more urgent
+        operation of the device, which would otherwise wait behind it for
+        the device lock, outside the slot queue.
+
+        Retries follow retry_policy (attempt limit, overall deadline,
+        exponential back-off with jitter, retryable errors only). Repeatedly
+        failing operations open the device's circuit breaker, after which
+        operations fail fast until its cool-down has passed, and then while
+        a single trial operation finds out whether the device is back.
         """
-        async with BT_SERIAL_LOCK:  # ← GLOBÁLNÍ zámek místo self._lock!
-            _LOGGER.debug("Acquired global BT lock for %s", self.address)
-            last_error = None
-            
-            for attempt in range(MAX_CONNECT_ATTEMPTS):
-                client = None
-                try:
-                    _LOGGER.debug(
-                        "Attempt %d/%d: Connecting to %s",
-                        attempt + 1,
-                        MAX_CONNECT_ATTEMPTS,
-                        self.address,
+        breaker = self.circuit_breaker
+        trial = breaker.state is CircuitState.HALF_OPEN
+        if not breaker.allow():
+            raise self._circuit_open_error()
+
+        wait_started = time.monotonic()
+        try:
+            async with self._lock:
+                # The circuit may have opened while this operation waited
+                if not trial and breaker.state is not CircuitState.CLOSED:
+                    raise self._circuit_open_error()
+                # Planned under the lock; each attempt keeps its path in a
+                # local, as advertisements may change the device's BLEDevice
+                paths = self._plan_paths()
+                scheduler = self._scheduler(paths[0].source)
+                async with scheduler.slot(priority) as slot:
+                    await self._execute_attempts(
+                        operation, paths, scheduler, slot, wait_started
                     )
-                    
-                    # Use bleak-retry-connector for reliable connection
-                    client = await establish_connection(
-                        BleakClient,
-                        self._ble_device,
-                        self.address,
-                        max_attempts=1,  # We handle retries ourselves
-                        timeout=CONNECTION_TIMEOUT,
+        finally:
+            if trial:
+                # Cancelled or skipped before an outcome - the next one tries
+                breaker.end_trial()
+
+    def _circuit_open_error(self) -> BleakError:
+        """Return the error refusing an operation while the circuit is open."""
+        if self.circuit_breaker.trial_running:
+            return BleakError(
+                f"{self.address} failed repeatedly, waiting for a trial operation"
+            )
+        return BleakError(
+            f"{self.address} failed repeatedly, not retrying for "
+            f"{self.circuit_breaker.retry_in:.0f}s"
+        )
+
+    async def _execute_attempts(
+        self,
+        operation: Callable[[BleakClient], Awaitable[None]],
+        paths: list[ConnectionPath],
+        scheduler: AdapterScheduler,
+        slot: SlotHandle,
+        wait_started: float,
+    ) -> None:
+        """Run the attempts of an operation over its paths, holding lock and slot."""
+        policy = self.retry_policy
+        path_index = 0
+        self.metrics.slot_wait.add(time.monotonic() - wait_started)
+        _LOGGER.debug(
+            "Acquired %s connection slot for %s", scheduler.source, self.address
+        )
+        self._cancel_linger()
+        deadline = time.monotonic() + policy.deadline
+        last_error = None
+        attempts = 0
+        
+        while attempts < policy.max_attempts:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            attempts += 1
+            client = None
+            path = paths[path_index]
+            if (path_scheduler := self._scheduler(path.source)) is not scheduler:
+                await slot.transfer(path_scheduler)
+                scheduler = path_scheduler
+            try:
+                await _release_lingering_sessions(self, scheduler)
+                _LOGGER.debug(
+                    "Attempt %d/%d: Connecting to %s via %s (%.0fs left)",
+                    attempts,
+                    policy.max_attempts,
+                    self.address,
+                    path.source,
+                    remaining,
+                )
+                
+                async with asyncio.timeout(remaining):
+                    client = await self._connect(
+                        path, min(policy.connect_timeout, remaining)
                     )
-                    
-                    # Try to pair if not already paired
-                    try:
-                        await client.pair()
-                        _LOGGER.debug("Pairing successful for %s", self.address)
-                    except Exception as pair_err:
-                        # Pairing might fail if already paired - that's OK
-                        _LOGGER.debug("Pairing skipped for %s: %s", self.address, pair_err)
+                    self._link_source = path.source
                     
                     if not client.is_connected:
                         raise BleakError("Failed to establish connection")
                     
-                    _LOGGER.debug("Connected to %s, executing operation", self.address)
+                    _LOGGER.debug(
+                        "Connected to %s, executing operation", self.address
+                    )
                     
                     # Execute the operation
                     await operation(client)
-                    
-                    _LOGGER.debug("Operation completed successfully")
-                    return  # Success!
-                    
-                except BleakError as err:
-                    last_error = err
-                    _LOGGER.warning(
-                        "BLE error on attempt %d/%d for %s: %s",
-                        attempt + 1,
-                        MAX_CONNECT_ATTEMPTS,
-                        self.address,
-                        err,
-                    )
-                except TimeoutError as err:
-                    last_error = err
-                    _LOGGER.warning(
-                        "Timeout on attempt %d/%d for %s: %s",
-                        attempt + 1,
-                        MAX_CONNECT_ATTEMPTS,
-                        self.address,
-                        err,
-                    )
-                except Exception as err:
-                    last_error = err
-                    _LOGGER.warning(
-                        "Unexpected error on attempt %d/%d for %s: %s (%s)",
-                        attempt + 1,
-                        MAX_CONNECT_ATTEMPTS,
+                
+                _LOGGER.debug("Operation completed successfully")
+                self.metrics.attempts.add(attempts)
+                self.metrics.successes += 1
+                self.last_connect_ok = True
+                self.circuit_breaker.record_success()
+                if self._router is not None:
+                    self._router.record_success(self.address, path.source)
+                # A completed operation proves the bond works
+                self._set_bonded(True)
+                if self.session_linger > 0:
+                    # Hand the open client over to the idle session
+                    self._client, client = client, None
+                    self._session_path = path
+                    self._schedule_linger()
+                return  # Success!
+                
+            except BleakError as err:
+                last_error = err
+                if any(m in str(err).lower() for m in AUTH_ERROR_MARKERS):
+                    # Bond lost or rejected - pair again on the next attempt
+                    self._set_bonded(False)
+                if any(m in str(err).lower() for m in GATT_LAYOUT_ERROR_MARKERS):
+                    await self._invalidate_gatt_cache(client)
+                _LOGGER.warning(
+                    "BLE error on attempt %d/%d for %s: %s",
+                    attempts,
+                    policy.max_attempts,
+                    self.address,
+                    err,
+                )
+            except TimeoutError as err:
+                last_error = err
+                _LOGGER.warning(
+                    "Timeout on attempt %d/%d for %s: %s",
+                    attempts,
+                    policy.max_attempts,
+                    self.address,
+                    err,
+                )
+            except Exception as err:
+                if not policy.is_retryable(err):
+                    # Not a link problem - retrying would not help
+                    _LOGGER.error(
+                        "Unexpected error for %s: %s (%s)",
                         self.address,
                         err,
                         type(err).__name__,
                     )
-                finally:
-                    # Always try to disconnect
-                    if client is not None:
-                        try:
-                            if client.is_connected:
-                                await client.disconnect()
-                                _LOGGER.debug("Disconnected from %s", self.address)
-                        except Exception as disconnect_err:
-                            _LOGGER.debug(
-                                "Error during disconnect from %s: %s",
-                                self.address,
-                                disconnect_err,
-                            )
-                
-                # Wait before retry (except on last attempt)
-                if attempt < MAX_CONNECT_ATTEMPTS - 1:
-                    _LOGGER.debug(
-                        "Waiting %.1f seconds before retry...", RETRY_DELAY
-                    )
-                    await asyncio.sleep(RETRY_DELAY)
+                    raise
+                last_error = err
+                _LOGGER.warning(
+                    "Unexpected error on attempt %d/%d for %s: %s (%s)",
+                    attempts,
+                    policy.max_attempts,
+                    self.address,
+                    err,
+                    type(err).__name__,
+                )
+            finally:
+                # Disconnect unless the client was kept as idle session
+                if client is not None:
+                    await self._disconnect_client(client)
+
+            if self._router is not None:
+                self._router.record_failure(self.address, path.source)
+            if path_index + 1 < len(paths):
+                # Next-best path right away, from the same attempt budget
+                path_index += 1
+                _LOGGER.debug(
+                    "Falling back to %s for %s",
+                    paths[path_index].source,
+                    self.address,
+                )
+                continue
+            path_index = 0
             
-            # All attempts failed
-            error_msg = f"Failed to communicate with device after {MAX_CONNECT_ATTEMPTS} attempts"
-            if last_error:
-                error_msg = f"{error_msg}: {last_error}"
-            _LOGGER.error(error_msg)
-            raise BleakError(error_msg)
-
-    async def update(self) -> None:
-        """Update device state by reading characteristics."""
+            # Back off before retry, unless out of attempts or time
+            delay = policy.delay(attempts - 1)
+            if (
+                attempts < policy.max_attempts
+                and time.monotonic() + delay < deadline
+            ):
+                _LOGGER.debug("Waiting %.1f seconds before retry...", delay)
+                await slot.pause(delay)
+            else:
+                break
+        
+        # All attempts failed
+        self.metrics.attempts.add(attempts)
+        self.metrics.failures += 1
+        self.last_connect_ok = False
+        self.circuit_breaker.record_failure()
+        error_msg = f"Failed to communicate with device after {attempts} attempts"
+        if last_error:
+            error_msg = f"{error_msg}: {last_error}"
+        _LOGGER.error(error_msg)
+        raise BleakError(error_msg)
+
+    def _decode_room_temp(self, data: bytearray) -> None:
+        """Update cached room temperatures from a characteristic value."""
+        frame = RoomTemperatureFrame.decode(data)
+        self._current_room_temp = frame.current
+        self._target_room_temp = frame.target
+        _LOGGER.debug("Room temp: %.1f°C / %.1f°C", frame.current, frame.target)
+
+    def _decode_element_temp(self, data: bytearray) -> None:
+        """Update cached element temperatures from a characteristic value."""
+        frame = ElementTemperatureFrame.decode(data)
+        self._current_element_temp = frame.current
+        self._target_element_temp = frame.target
+        _LOGGER.debug("Element temp: %.1f°C / %.1f°C", frame.current, frame.target)
+
+    def _decode_mode(self, data: bytearray) -> None:
+        """Update cached operating mode from a characteristic value."""
+        frame = ModeFrame.decode(data)
+        self._mode = frame.mode
+        if self._mode is None:
+            _LOGGER.warning("Unknown mode value: %d", frame.value)
+        else:
+            _LOGGER.debug("Mode: %s", self._mode.name)
+
+    def _decode(self, uuid: str, data: bytearray) -> None:
+        """Update the cached state from the value of a characteristic."""
+        if uuid == CHAR_ROOM_TEMP:
+            self._decode_room_temp(data)
+        elif uuid == CHAR_ELEMENT_TEMP:
+            self._decode_element_temp(data)
+        else:
+            self._decode_mode(data)
+
+    def _read_ttl(self, uuid: str) -> float:
+        """Return how long a value read from a characteristic stays fresh."""
+        if uuid == CHAR_MODE:
+            return READ_TTL_MODE
+        if uuid == CHAR_ELEMENT_TEMP:
+            # The element temperature moves quickly while it is on
+            return 0.0 if self._mode == OperatingMode.ON else READ_TTL_ELEMENT
+        return READ_TTL_ROOM
+
+    def plan_reads(self) -> list[str]:
+        """Return the characteristics whose cached value is no longer fresh.
+
+        Writes read back the characteristic they changed, which counts as a
+        read here, so a poll after a write only reads the other ones.
+        """
+        now = time.monotonic()
+        return [
+            uuid
+            for uuid in CHARACTERISTICS
+            if (read_at := self._read_at.get(uuid)) is None
+            or now - read_at >= self._read_ttl(uuid)
+        ]
+
+    async def _read_many(self, client: BleakClient, uuids: list[str]) -> None:
+        """Read and decode characteristics, concurrently if enabled.
+
+        An adapter rejecting overlapping requests is remembered; the rejected
+        reads are repeated one by one and later sessions read sequentially.
+        """
+        adapter = self._link_source or self.adapter
+        if (
+            not self.pipeline_reads
+            or len(uuids) < 2
+            or adapter in self._serial_adapters
+        ):
+            for uuid in uuids:
+                self._decode(uuid, await self._read(client, uuid))
+            return
+
+        results = await asyncio.gather(
+            *(self._read(client, uuid) for uuid in uuids), return_exceptions=True
+        )
+        rejected: list[str] = []
+        for uuid, result in zip(uuids, results):
+            if not isinstance(result, BaseException):
+                self._decode(uuid, result)
+            elif isinstance(result, BleakError) and any(
+                m in str(result).lower() for m in OVERLAP_ERROR_MARKERS
+            ):
+                rejected.append(uuid)
+            else:
+                raise result
+        if rejected:
+            _LOGGER.info(
+                "Adapter %s cannot overlap GATT reads, reading sequentially",
+                adapter,
+            )
+            self._serial_adapters.add(adapter)
+            for uuid in rejected:
+                self._decode(uuid, await self._read(client, uuid))
+
+    async def update(
+        self,
+        priority: OperationPriority = OperationPriority.POLL,
+        force: bool = False,
+    ) -> DeviceSnapshot:
+        """Update device state by reading the characteristics due for a read.
+
+        With force all characteristics are read, regardless of freshness.
+        Returns a snapshot of the updated state.
+        """
+        plan = list(CHARACTERISTICS) if force else self.plan_reads()
+        self.reads_skipped += len(CHARACTERISTICS) - len(plan)
+        if not plan:
+            _LOGGER.debug("State of %s is fresh, nothing to read", self.address)
+            return self.snapshot()
+        _LOGGER.debug(
+            "Reading %d of %d characteristics of %s",
+            len(plan),
+            len(CHARACTERISTICS),
+            self.address,
+        )
+
+        read = _QueuedRead(priority)
+        self._queued_reads.append(read)
+
         async def read_state(client: BleakClient) -> None:
-            # Read room temperature
-            room_temp_data = await client.read_gatt_char(CHAR_ROOM_TEMP)
-            if len(room_temp_data) >= 4:
-                current = struct.unpack("<H", room_temp_data[0:2])[0] / 10.0
-                target = struct.unpack("<H", room_temp_data[2:4])[0] / 10.0
-                self._current_room_temp = current
-                self._target_room_temp = target
-                _LOGGER.debug("Room temp: %.1f°C / %.1f°C", current, target)
-
-            # Read element temperature
-            element_temp_data = await client.read_gatt_char(CHAR_ELEMENT_TEMP)
-            if len(element_temp_data) >= 4:
-                current = struct.unpack("<H", element_temp_data[0:2])[0] / 10.0
-                target = struct.unpack("<H", element_temp_data[2:4])[0] / 10.0
-                self._current_element_temp = current
-                self._target_element_temp = target
-                _LOGGER.debug("Element temp: %.1f°C / %.1f°C", current, target)
-
-            # Read mode
-            mode_data = await client.read_gatt_char(CHAR_MODE)
-            if len(mode_data) >= 1:
-                mode_value = mode_data[0]
-                try:
-                    self._mode = OperatingMode(mode_value)
-                    _LOGGER.debug("Mode: %s", self._mode.name)
-                except ValueError:
-                    _LOGGER.warning("Unknown mode value: %d", mode_value)
-                    self._mode = None
-
-        await self._execute_with_connection(read_state)
+            # Reading has started - no longer skipped for other operations
+            read.started = True
+            await self._read_many(client, plan)
+            self._state_fresh = all(
+                uuid in self._read_at for uuid in CHARACTERISTICS
+            )
+
+        await self._run(read_state, priority, read=read)
+        return self.snapshot()
+
+    async def _write_room_temperature(
+        self, client: BleakClient, temperature: float
+    ) -> None:
+        """Write target room temperature on an open connection."""
+        new_data = RoomTemperatureFrame.encode_setpoint(temperature)
+        await self._write(client, CHAR_ROOM_TEMP, new_data)
+
+        # Small delay after write to ensure it's processed
+        await asyncio.sleep(0.1)
+
+        self._target_room_temp = temperature
+        _LOGGER.info("Set room temperature to %.1f°C", temperature)
+
+        # Read back in the same session - refreshes the cached state
+        self._decode_room_temp(await self._read(client, CHAR_ROOM_TEMP))
+
+    async def _write_element_temperature(
+        self, client: BleakClient, temperature: float
+    ) -> None:
+        """Write target element temperature on an open connection."""
+        new_data = ElementTemperatureFrame.encode_setpoint(temperature)
+        _LOGGER.debug(
+            "Writing element temp %.1f°C: %s", temperature, HexBytes(new_data)
+        )
+
+        await self._write(client, CHAR_ELEMENT_TEMP, new_data)
+
+        # Small delay after write
+        await asyncio.sleep(0.1)
+
+        self._target_element_temp = temperature
+        _LOGGER.info("Set element temperature to %.1f°C", temperature)
+
+        # Read back to verify - refreshes the cached state
+        verify_data = await self._read(client, CHAR_ELEMENT_TEMP)
+        _LOGGER.debug("Verify element temp: %s", HexBytes(verify_data))
+        self._decode_element_temp(verify_data)
+
+    async def _write_mode(self, client: BleakClient, mode: OperatingMode) -> None:
+        """Write operating mode on an open connection."""
+        mode_data = ModeFrame.encode(mode)
+        await self._write(client, CHAR_MODE, mode_data)
+        self._mode = mode
+        _LOGGER.info("Set mode to %s", mode.name)
+
+        # Read back in the same session - refreshes the cached state
+        self._decode_mode(await self._read(client, CHAR_MODE))
+
+    async def _queue_setpoint(self, field: str, temperature: float) -> None:
+        """Write a setpoint after the debounce window, merged with later ones.
+
+        Setpoints requested within write_debounce seconds of each other are
+        written together in one session, the last value per characteristic
+        winning. Every caller waits for that merged write and sees its result.
+        """
+        if self.write_debounce <= 0:
+            await self.apply(**{field: temperature})
+            return
+
+        loop = asyncio.get_running_loop()
+        if field in self._pending_setpoints:
+            self.setpoint_writes_merged += 1
+        self._pending_setpoints[field] = temperature
+        if self._pending_future is None:
+            self._pending_future = loop.create_future()
+        future = self._pending_future
+        if self._debounce_handle is not None:
+            self._debounce_handle.cancel()
+        self._debounce_handle = loop.call_later(
+            self.write_debounce, self._flush_setpoints
+        )
+        # Shielded - one caller giving up must not cancel the others' write
+        await asyncio.shield(future)
+
+    def _flush_setpoints(self) -> None:
+        """Write the merged pending setpoints in one session."""
+        self._debounce_handle = None
+        setpoints, self._pending_setpoints = self._pending_setpoints, {}
+        future, self._pending_future = self._pending_future, None
+        if future is None:
+            return
+
+        async def _write() -> None:
+            try:
+                await self.apply(**setpoints)
+            except Exception as err:  # handed to every waiting caller
+                future.set_exception(err)
+            else:
+                future.set_result(None)
+
+        _LOGGER.debug("Writing merged setpoints to %s: %s", self.address, setpoints)
+        self._create_background_task(_write())
 
     async def set_room_temperature(self, temperature: float) -> None:
         """Set target room temperature."""
-        async def write_temp(client: BleakClient) -> None:
-            temp_value = int(temperature * 10)
-            
-            # Mobile app ALWAYS sends [0x00, 0x00, target_low, target_high]
-            new_data = bytes([0x00, 0x00]) + struct.pack("<H", temp_value)
-            await client.write_gatt_char(CHAR_ROOM_TEMP, new_data)
-            
-            # Small delay after write to ensure it's processed
-            await asyncio.sleep(0.1)
-            
-            self._target_room_temp = temperature
-            _LOGGER.info("Set room temperature to %.1f°C", temperature)
-
-        await self._execute_with_connection(write_temp)
+        await self._queue_setpoint("room_temperature", temperature)
 
     async def set_element_temperature(self, temperature: float) -> None:
         """Set target element temperature."""
-        async def write_temp(client: BleakClient) -> None:
-            temp_value = int(temperature * 10)
-            
-            # Mobile app ALWAYS sends [0x00, 0x00, target_low, target_high]
-            # NOT [current_low, current_high, target_low, target_high]
-            new_data = bytes([0x00, 0x00]) + struct.pack("<H", temp_value)
-            
-            _LOGGER.info("Writing element temp %.1f°C: %s (hex: %s)", 
-                        temperature, [b for b in new_data], new_data.hex())
-            
-            await client.write_gatt_char(CHAR_ELEMENT_TEMP, new_data)
-            
-            # Small delay after write
-            await asyncio.sleep(0.1)
-            
-            # Read back to verify
-            verify_data = await client.read_gatt_char(CHAR_ELEMENT_TEMP)
-            _LOGGER.info("Verify element temp: %s (hex: %s)", 
-                        [b for b in verify_data], verify_data.hex())
-            
-            self._target_element_temp = temperature
-            _LOGGER.info("Set element temperature to %.1f°C", temperature)
-
-        await self._execute_with_connection(write_temp)
+        await self._queue_setpoint("element_temperature", temperature)
 
     async def set_mode(self, mode: OperatingMode) -> None:
         """Set operating mode."""
-        async def write_mode(client: BleakClient) -> None:
-            # Mode is 4 bytes: [mode, 0x00, 0x00, 0x00]
-            mode_data = bytes([mode.value, 0x00, 0x00, 0x00])
-            await client.write_gatt_char(CHAR_MODE, mode_data)
-            self._mode = mode
-            _LOGGER.info("Set mode to %s", mode.name)
-
-        await self._execute_with_connection(write_mode)
+        await self.apply(mode=mode)
+
+    def drifted(self) -> DesiredState:
+        """Return the desired fields the observed state does not match."""
+        desired = self.desired
+        return DesiredState(
+            mode=(
+                desired.mode
+                if desired.mode is not None
+                and self._mode is not None
+                and not _modes_match(desired.mode, self._mode)
+                else None
+            ),
+            room_temperature=(
+                desired.room_temperature
+                if not _temps_match(desired.room_temperature, self._target_room_temp)
+                else None
+            ),
+            element_temperature=(
+                desired.element_temperature
+                if not _temps_match(
+                    desired.element_temperature, self._target_element_temp
+                )
+                else None
+            ),
+        )
+
+    async def reconcile(self) -> bool:
+        """Check observed state against desired state after a read.
+
+        Fields changed on the radiator itself (e.g. switched off by hand,
+        OFF_MANUAL) are written back when reapply_desired is set; otherwise
+        the observed values are adopted as the new desired state. Returns
+        True if anything was written.
+        """
+        drift = self.drifted()
+        if drift.is_empty:
+            return False
+
+        _LOGGER.info("State of %s differs from desired state: %s", self.address, drift)
+        if not self.reapply_desired:
+            self.desired = DesiredState(
+                mode=self._mode,
+                room_temperature=self._target_room_temp,
+                element_temperature=self._target_element_temp,
+            )
+            return False
+
+        await self.apply(
+            mode=drift.mode,
+            room_temperature=drift.room_temperature,
+            element_temperature=drift.element_temperature,
+            priority=OperationPriority.VERIFY,
+        )
+        return True
+
+    async def apply(
+        self,
+        mode: OperatingMode | None = None,
+        room_temperature: float | None = None,
+        element_temperature: float | None = None,
+        priority: OperationPriority = OperationPriority.INTERACTIVE,
+    ) -> None:
+        """Apply mode and setpoints as one transaction in a single BLE session.
+
+        The values become the desired state; only fields that differ from the
+        observed state are written, so a no-op request costs no connection.
+        Mode is written first so that a heat-on followed by new setpoints
+        behaves the same as the separate service calls did.
+        """
+        self.desired = DesiredState(
+            mode=mode if mode is not None else self.desired.mode,
+            room_temperature=(
+                room_temperature
+                if room_temperature is not None
+                else self.desired.room_temperature
+            ),
+            element_temperature=(
+                element_temperature
+                if element_temperature is not None
+                else self.desired.element_temperature
+            ),
+        )
+
+        requested = {
+            field: value
+            for field, value in (
+                ("mode", mode),
+                ("room_temperature", room_temperature),
+                ("element_temperature", element_temperature),
+            )
+            if value is not None
+        }
+        # Older queued writes of the requested fields are obsolete - also when
+        # the new value turns out to be a no-op below, or they would undo it
+        self._supersede_queued_writes(requested)
+
+        # Restored values may be outdated - only a fresh state can skip writes.
+        # A field with a write still pending is not a no-op even if the
+        # observed state matches: the pending write would overwrite it.
+        values = requested
+        if self._state_fresh:
+            values = {
+                field: value
+                for field, value in requested.items()
+                if self._write_pending(field) or not self._matches(field, value)
+            }
+            if skipped := len(requested) - len(values):
+                self.writes_avoided += skipped
+                _LOGGER.debug(
+                    "Skipping %d write(s) to %s already matching its state",
+                    skipped,
+                    self.address,
+                )
+        if not values:
+            return
+
+        write = _QueuedWrite(values)
+        self._queued_writes.append(write)
+
+        async def write_all(client: BleakClient) -> None:
+            # Writing has started - the fields can no longer be taken over
+            write.started = True
+            if (value := write.values.get("mode")) is not None:
+                await self._write_mode(client, value)
+            if (value := write.values.get("room_temperature")) is not None:
+                await self._write_room_temperature(client, value)
+            if (value := write.values.get("element_temperature")) is not None:
+                await self._write_element_temperature(client, value)
+
+        await self._run(write_all, priority, write)
 
     async def turn_on(self, use_room_temp: bool = True) -> None:
         """Turn on the heater."""
@@ -0,0 +1,57 @@
+"""Persistent Bluetooth bond state for Terma MOA Blue devices."""
+from __future__ import annotations
+
+import logging
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_KEY = f"{DOMAIN}.bonds"
+STORAGE_VERSION = 1
+SAVE_DELAY = 10  # seconds - coalesce bursts of bond changes into one write
+
+
+class TermaMoaBlueBondStore:
+    """Remember which device addresses are bonded, across restarts.
+
+    Devices only call client.pair() when the bond state of their address
+    is unknown, i.e. not in this store.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the store."""
+        self._store: Store[dict[str, list[str]]] = Store(
+            hass, STORAGE_VERSION, STORAGE_KEY
+        )
+        self._bonded: set[str] = set()
+
+    async def async_load(self) -> None:
+        """Load bond state from storage."""
+        if (data := await self._store.async_load()) is not None:
+            self._bonded = set(data.get("bonded", []))
+        _LOGGER.debug("Loaded bond state for %d devices", len(self._bonded))
+
+    def is_bonded(self, address: str) -> bool:
+        """Return True if the address is known to be bonded."""
+        return address in self._bonded
+
+    @callback
+    def async_set_bonded(self, address: str, bonded: bool) -> None:
+        """Record the bond state of an address."""
+        if bonded == (address in self._bonded):
+            return
+        if bonded:
+            self._bonded.add(address)
+        else:
+            self._bonded.discard(address)
+        _LOGGER.debug("Bond state of %s is now %s", address, bonded)
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, list[str]]:
+        """Return data to persist."""
+        return {"bonded": sorted(self._bonded)}
@@ -4,7 +4,10 @@ from __future__ import annotations
 import logging
 from typing import Any
 
+import voluptuous as vol
+
 from homeassistant.components.climate import (
+    ATTR_HVAC_MODE,
     ClimateEntity,
     ClimateEntityFeature,
     HVACAction,
@@ -13,21 +16,40 @@ from homeassistant.components.climate import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_platform
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
+    ATTR_ELEMENT_TEMPERATURE,
+    ATTR_ROOM_TEMPERATURE,
+    CONF_ENTRY_TYPE,
     DOMAIN,
+    ENTRY_TYPE_CONTROLLER,
     MAX_ELEMENT_TEMP,
     MAX_ROOM_TEMP,
     MIN_ELEMENT_TEMP,
     MIN_ROOM_TEMP,
+    SERVICE_APPLY,
     OperatingMode,
 )
+from .controller import TermaMoaBlueThermostatController
 from .coordinator import TermaMoaBlueCoordinator
+from .entity import TermaMoaBlueEntity
 
 _LOGGER = logging.getLogger(__name__)
 
+APPLY_SCHEMA = {
+    vol.Optional(ATTR_HVAC_MODE): vol.All(
+        vol.Coerce(HVACMode), vol.In([HVACMode.OFF, HVACMode.HEAT])
+    ),
+    vol.Optional(ATTR_ROOM_TEMPERATURE): vol.All(
+        vol.Coerce(float), vol.Range(min=MIN_ROOM_TEMP, max=MAX_ROOM_TEMP)
+    ),
+    vol.Optional(ATTR_ELEMENT_TEMPERATURE): vol.All(
+        vol.Coerce(float), vol.Range(min=MIN_ELEMENT_TEMP, max=MAX_ELEMENT_TEMP)
+    ),
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -35,6 +57,10 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Terma MOA Blue climate entities."""
+    if entry.data.get(CONF_ENTRY_TYPE) == ENTRY_TYPE_CONTROLLER:
+        async_add_entities([TermaMoaBlueThermostatController(entry)])
+        return
+
     coordinator: TermaMoaBlueCoordinator = hass.data[DOMAIN][entry.entry_id]
 
     async_add_entities(
@@ -44,8 +70,11 @@ async def async_setup_entry(
         ]
     )
 
+    platform = entity_platform.async_get_current_platform()
+    platform.async_register_entity_service(SERVICE_APPLY, APPLY_SCHEMA, "async_apply")
+
 
-class TermaMoaBlueClimate(CoordinatorEntity[TermaMoaBlueCoordinator], ClimateEntity):
+class TermaMoaBlueClimate(TermaMoaBlueEntity, ClimateEntity):
     """Representation of a Terma MOA Blue climate entity."""
 
     _attr_temperature_unit = UnitOfTemperature.CELSIUS
@@ -53,7 +82,6 @@ class TermaMoaBlueClimate(CoordinatorEntity[TermaMoaBlueCoordinator], ClimateEnt
         ClimateEntityFeature.TARGET_TEMPERATURE | ClimateEntityFeature.TURN_OFF
     )
     _attr_hvac_modes = [HVACMode.OFF, HVACMode.HEAT]
-    _attr_has_entity_name = True
 
     def __init__(
         self, coordinator: TermaMoaBlueCoordinator, use_room_temp: bool
@@ -63,7 +91,6 @@ class TermaMoaBlueClimate(CoordinatorEntity[TermaMoaBlueCoordinator], ClimateEnt
         self._use_room_temp = use_room_temp
 
         # Set entity attributes
-        device_name = coordinator.device.name
         if use_room_temp:
             self._attr_name = "Room Temperature"
             self._attr_unique_id = f"{coordinator.device.address}_room_climate"
@@ -75,31 +102,37 @@ class TermaMoaBlueClimate(CoordinatorEntity[TermaMoaBlueCoordinator], ClimateEnt
             self._attr_min_temp = MIN_ELEMENT_TEMP
             self._attr_max_temp = MAX_ELEMENT_TEMP
 
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, coordinator.device.address)},
-            "name": device_name,
-            "manufacturer": "Terma",
-            "model": "MOA Blue",
-        }
+    def _exact_projection(self) -> tuple[Any, ...]:
+        """Return the shown values that update the entity on any change."""
+        return (
+            self.target_temperature,
+            self.hvac_mode,
+            self.hvac_action,
+            self.coordinator.data.stale,
+        )
+
+    def _measured_projection(self) -> tuple[float | None, ...]:
+        """Return the shown measurements subject to the deadband."""
+        return (self.current_temperature,)
 
     @property
     def current_temperature(self) -> float | None:
         """Return the current temperature."""
         if self._use_room_temp:
-            return self.coordinator.device.current_room_temp
-        return self.coordinator.device.current_element_temp
+            return self.coordinator.data.current_room_temp
+        return self.coordinator.data.current_element_temp
 
     @property
     def target_temperature(self) -> float | None:
         """Return the target temperature."""
         if self._use_room_temp:
-            return self.coordinator.device.target_room_temp
-        return self.coordinator.device.target_element_temp
+            return self.coordinator.data.target_room_temp
+        return self.coordinator.data.target_element_temp
 
     @property
     def hvac_mode(self) -> HVACMode:
         """Return hvac operation mode."""
-        mode = self.coordinator.device.mode
+        mode = self.coordinator.data.mode
 
         # Nové hodnoty z Frida: OFF=0x20, ON=0x21
         # Ale zařízení může vracet i 0x00 (vypnuto manuálně)
@@ -123,6 +156,12 @@ class TermaMoaBlueClimate(CoordinatorEntity[TermaMoaBlueCoordinator], ClimateEnt
 
         return HVACMode.OFF
 
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return additional state attributes."""
+        # True while showing the restored state of the last run
+        return {"stale": self.coordinator.data.stale}
+
     @property
     def hvac_action(self) -> HVACAction:
         """Return the current running hvac operation."""
@@ -151,7 +190,11 @@ class TermaMoaBlueClimate(CoordinatorEntity[TermaMoaBlueCoordinator], ClimateEnt
                 await self.coordinator.device.set_room_temperature(temperature)
             else:
                 await self.coordinator.device.set_element_temperature(temperature)
-            await self.coordinator.async_request_refresh()
+            # The write session already read the state back - push it to
+            # entities and restart the poll timer instead of reconnecting
+            self.coordinator.async_set_updated_data(
+                self.coordinator.device.snapshot()
+            )
         except Exception as err:
             _LOGGER.error("Failed to set temperature: %s", err)
             raise
@@ -163,7 +206,35 @@ class TermaMoaBlueClimate(CoordinatorEntity[TermaMoaBlueCoordinator], ClimateEnt
                 await self.coordinator.device.turn_off()
             elif hvac_mode == HVACMode.HEAT:
                 await self.coordinator.device.turn_on(use_room_temp=self._use_room_temp)
-            await self.coordinator.async_request_refresh()
+            self.coordinator.async_set_updated_data(
+                self.coordinator.device.snapshot()
+            )
         except Exception as err:
             _LOGGER.error("Failed to set HVAC mode: %s", err)
             raise
+
+    async def async_apply(
+        self,
+        hvac_mode: HVACMode | None = None,
+        room_temperature: float | None = None,
+        element_temperature: float | None = None,
+    ) -> None:
+        """Apply mode and setpoints to the device in a single BLE session."""
+        mode: OperatingMode | None = None
+        if hvac_mode == HVACMode.OFF:
+            mode = OperatingMode.OFF
+        elif hvac_mode == HVACMode.HEAT:
+            mode = OperatingMode.ON
+
+        try:
+            await self.coordinator.device.apply(
+                mode=mode,
+                room_temperature=room_temperature,
+                element_temperature=element_temperature,
+            )
+            self.coordinator.async_set_updated_data(
+                self.coordinator.device.snapshot()
+            )
+        except Exception as err:
+            _LOGGER.error("Failed to apply settings: %s", err)
+            raise
@@ -0,0 +1,102 @@
+"""Encoding and decoding of Terma MOA Blue characteristic values."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+import struct
+from typing import Self
+
+from .const import OperatingMode
+
+# Temperature characteristics: current and target in 0.1°C units, little endian
+_TEMPERATURES = struct.Struct("<HH")
+# Mode characteristic: mode byte followed by three zero bytes
+_MODE = struct.Struct("<B3x")
+_MIN_MODE_LENGTH = 1  # only the first byte carries the mode
+_MODES = {mode.value: mode for mode in OperatingMode}
+
+
+class FrameError(ValueError):
+    """Characteristic value with an unexpected length."""
+
+
+def raw_temperature(temperature: float) -> int:
+    """Return a temperature in the protocol's 0.1°C units."""
+    return round(temperature * 10)
+
+
+@dataclass(slots=True)
+class TemperatureFrame:
+    """Current and target temperature of a temperature characteristic."""
+
+    current: float
+    target: float
+
+    @classmethod
+    def decode(cls, data: bytes | bytearray | memoryview) -> Self:
+        """Decode a 4-byte characteristic value in place, without slicing."""
+        if len(data) != _TEMPERATURES.size:
+            raise FrameError(
+                f"{cls.__name__} must be {_TEMPERATURES.size} bytes, got {len(data)}"
+            )
+        current, target = _TEMPERATURES.unpack_from(data)
+        return cls(current / 10.0, target / 10.0)
+
+    @staticmethod
+    def encode_setpoint(target: float) -> bytes:
+        """Encode a setpoint write.
+
+        The mobile app always sends [0x00, 0x00, target_low, target_high],
+        NOT the current temperature in the first two bytes.
+        """
+        return _TEMPERATURES.pack(0, raw_temperature(target))
+
+
+@dataclass(slots=True)
+class RoomTemperatureFrame(TemperatureFrame):
+    """Value of the room temperature characteristic."""
+
+
+@dataclass(slots=True)
+class ElementTemperatureFrame(TemperatureFrame):
+    """Value of the element temperature characteristic."""
+
+
+@dataclass(slots=True)
+class ModeFrame:
+    """Value of the mode characteristic; raw value kept for unknown modes."""
+
+    value: int
+
+    @property
+    def mode(self) -> OperatingMode | None:
+        """Return the operating mode, None if unknown."""
+        return _MODES.get(self.value)
+
+    @classmethod
+    def decode(cls, data: bytes | bytearray | memoryview) -> Self:
+        """Decode a mode value of 1 to 4 bytes."""
+        if not _MIN_MODE_LENGTH <= len(data) <= _MODE.size:
+            raise FrameError(
+                f"{cls.__name__} must be {_MIN_MODE_LENGTH}-{_MODE.size} bytes,"
+                f" got {len(data)}"
+            )
+        return cls(data[0])
+
+    @staticmethod
+    def encode(mode: OperatingMode) -> bytes:
+        """Encode a mode write."""
+        return _MODE.pack(mode)
+
+
+class HexBytes:
+    """Log argument rendering bytes as hex only when the record is emitted."""
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: bytes | bytearray | memoryview) -> None:
+        """Initialize the wrapper."""
+        self._data = data
+
+    def __str__(self) -> str:
+        """Return the bytes as hex."""
+        return bytes(self._data).hex(" ")
@@ -12,13 +12,84 @@ from homeassistant.components.bluetooth import (
     BluetoothServiceInfoBleak,
     async_discovered_service_info,
 )
-from homeassistant.const import CONF_ADDRESS
+from homeassistant.components.sensor import DOMAIN as SENSOR_DOMAIN, SensorDeviceClass
+from homeassistant.const import CONF_ADDRESS, CONF_NAME
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.selector import EntitySelector, EntitySelectorConfig
 
-from .const import DOMAIN, SERVICE_UUID
+from .const import (
+    CONF_ADAPTER_CONCURRENCY,
+    CONF_ADDRESSES,
+    CONF_ENTRY_TYPE,
+    CONF_FLEET_POLLING,
+    CONF_HEATING_ELEMENT_TEMP,
+    CONF_HYSTERESIS,
+    CONF_MIN_DWELL,
+    CONF_PIPELINE_READS,
+    CONF_POLL_CEILING,
+    CONF_POLL_FLOOR,
+    CONF_RADIATORS,
+    CONF_REAPPLY_DESIRED,
+    CONF_SESSION_LINGER,
+    CONF_STATE_DEADBAND,
+    CONF_TEMPERATURE_SENSOR,
+    CONF_WRITE_DEBOUNCE,
+    DEFAULT_ADAPTER_CONCURRENCY,
+    DEFAULT_FLEET_POLLING,
+    DEFAULT_HEATING_ELEMENT_TEMP,
+    DEFAULT_HYSTERESIS,
+    DEFAULT_MIN_DWELL,
+    DEFAULT_PIPELINE_READS,
+    DEFAULT_POLL_CEILING,
+    DEFAULT_POLL_FLOOR,
+    DEFAULT_REAPPLY_DESIRED,
+    DEFAULT_SESSION_LINGER,
+    DEFAULT_STATE_DEADBAND,
+    DEFAULT_WRITE_DEBOUNCE,
+    DOMAIN,
+    ENTRY_TYPE_CONTROLLER,
+    MAX_ADAPTER_CONCURRENCY,
+    MAX_ELEMENT_TEMP,
+    MAX_HYSTERESIS,
+    MAX_MIN_DWELL,
+    MAX_POLL_INTERVAL,
+    MAX_SESSION_LINGER,
+    MAX_STATE_DEADBAND,
+    MAX_WRITE_DEBOUNCE,
+    MIN_ELEMENT_TEMP,
+    MIN_POLL_INTERVAL,
+    SERVICE_UUID,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+DEFAULT_CONTROLLER_NAME = "Terma MOA Blue Thermostat"
+
+
+def _controller_options_schema(options: dict[str, Any]) -> dict[vol.Marker, Any]:
+    """Return the schema of the thermostat controller tunables."""
+    return {
+        vol.Optional(
+            CONF_HYSTERESIS,
+            default=options.get(CONF_HYSTERESIS, DEFAULT_HYSTERESIS),
+        ): vol.All(vol.Coerce(float), vol.Range(min=0, max=MAX_HYSTERESIS)),
+        vol.Optional(
+            CONF_HEATING_ELEMENT_TEMP,
+            default=options.get(
+                CONF_HEATING_ELEMENT_TEMP, DEFAULT_HEATING_ELEMENT_TEMP
+            ),
+        ): vol.All(
+            vol.Coerce(float),
+            vol.Range(min=MIN_ELEMENT_TEMP, max=MAX_ELEMENT_TEMP),
+        ),
+        vol.Optional(
+            CONF_MIN_DWELL,
+            default=options.get(CONF_MIN_DWELL, DEFAULT_MIN_DWELL),
+        ): vol.All(vol.Coerce(int), vol.Range(min=0, max=MAX_MIN_DWELL)),
+    }
+
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Terma MOA Blue."""
@@ -30,6 +101,14 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self._discovery_info: BluetoothServiceInfoBleak | None = None
         self._discovered_devices: dict[str, str] = {}
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> OptionsFlowHandler:
+        """Get the options flow for this handler."""
+        return OptionsFlowHandler()
+
     async def async_step_bluetooth(
         self, discovery_info: BluetoothServiceInfoBleak
     ) -> FlowResult:
@@ -59,33 +138,119 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             },
         )
 
+    def _radiator_entries(self) -> dict[str, str]:
+        """Return the configured radiators by address, with their titles."""
+        return {
+            entry.unique_id: entry.title
+            for entry in self._async_current_entries(include_ignore=False)
+            if entry.unique_id is not None
+            and entry.data.get(CONF_ENTRY_TYPE) != ENTRY_TYPE_CONTROLLER
+        }
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
-        """Handle the user step to pick discovered device."""
+        """Add radiators, or a thermostat controller once radiators exist."""
+        if not self._radiator_entries():
+            return await self.async_step_radiators()
+        return self.async_show_menu(
+            step_id="user", menu_options=["radiators", "controller"]
+        )
+
+    async def async_step_controller(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Set up a thermostat controller for a group of radiators."""
+        errors: dict[str, str] = {}
+        radiators = self._radiator_entries()
         if user_input is not None:
-            address = user_input[CONF_ADDRESS]
-            await self.async_set_unique_id(address, raise_on_progress=False)
-            self._abort_if_unique_id_configured()
-            return self.async_create_entry(
-                title=self._discovered_devices[address],
-                data={CONF_ADDRESS: address},
-            )
+            if user_input[CONF_RADIATORS]:
+                return self.async_create_entry(
+                    title=user_input[CONF_NAME],
+                    data={
+                        CONF_ENTRY_TYPE: ENTRY_TYPE_CONTROLLER,
+                        CONF_TEMPERATURE_SENSOR: user_input[CONF_TEMPERATURE_SENSOR],
+                        CONF_RADIATORS: user_input[CONF_RADIATORS],
+                    },
+                    options={
+                        key: user_input[key]
+                        for key in (
+                            CONF_HYSTERESIS,
+                            CONF_HEATING_ELEMENT_TEMP,
+                            CONF_MIN_DWELL,
+                        )
+                    },
+                )
+            errors["base"] = "no_devices_selected"
+
+        return self.async_show_form(
+            step_id="controller",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_NAME, default=DEFAULT_CONTROLLER_NAME): str,
+                    vol.Required(CONF_TEMPERATURE_SENSOR): EntitySelector(
+                        EntitySelectorConfig(
+                            domain=SENSOR_DOMAIN,
+                            device_class=SensorDeviceClass.TEMPERATURE,
+                        )
+                    ),
+                    vol.Required(CONF_RADIATORS): cv.multi_select(radiators),
+                    **_controller_options_schema({}),
+                }
+            ),
+            errors=errors,
+        )
+
+    async def async_step_radiators(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Handle the step to pick one or more discovered devices.
+
+        This flow creates the entry of the first selected device; each
+        further device gets its own entry through an import flow. Their
+        first refreshes are staggered by the shared warm-up queue.
+        """
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            if addresses := user_input[CONF_ADDRESSES]:
+                first, *others = addresses
+                for address in others:
+                    self.hass.async_create_task(
+                        self.hass.config_entries.flow.async_init(
+                            DOMAIN,
+                            context={"source": config_entries.SOURCE_IMPORT},
+                            data={
+                                CONF_ADDRESS: address,
+                                CONF_NAME: self._discovered_devices[address],
+                            },
+                        )
+                    )
+                await self.async_set_unique_id(first, raise_on_progress=False)
+                self._abort_if_unique_id_configured()
+                return self.async_create_entry(
+                    title=self._discovered_devices[first],
+                    data={CONF_ADDRESS: first},
+                )
+            errors["base"] = "no_devices_selected"
 
         current_addresses = self._async_current_ids()
         _LOGGER.debug("Current configured addresses: %s", current_addresses)
         
-        # Scan all Bluetooth devices for debugging
-        all_devices = []
+        # List of all Bluetooth devices, for debugging only
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        all_devices: list[str] = []
+        seen = 0
         for discovery_info in async_discovered_service_info(self.hass):
-            all_devices.append(f"{discovery_info.name} ({discovery_info.address})")
-            _LOGGER.debug(
-                "Found BLE device: %s (%s) - RSSI: %s - Services: %s",
-                discovery_info.name,
-                discovery_info.address,
-                discovery_info.rssi,
-                discovery_info.service_uuids,
-            )
+            seen += 1
+            if debug:
+                all_devices.append(f"{discovery_info.name} ({discovery_info.address})")
+                _LOGGER.debug(
+                    "Found BLE device: %s (%s) - RSSI: %s - Services: %s",
+                    discovery_info.name,
+                    discovery_info.address,
+                    discovery_info.rssi,
+                    discovery_info.service_uuids,
+                )
             
             if (
                 discovery_info.address in current_addresses
@@ -110,18 +275,150 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     discovery_info.address
                 ] = f"{discovery_info.name} ({discovery_info.address})"
 
-        _LOGGER.info("Total BLE devices found: %d", len(all_devices))
+        _LOGGER.info("Total BLE devices found: %d", seen)
         _LOGGER.info("Terma devices found: %d", len(self._discovered_devices))
         
         if not self._discovered_devices:
-            _LOGGER.warning("No Terma MOA Blue devices found. All BLE devices: %s", all_devices)
+            _LOGGER.warning("No Terma MOA Blue devices found among %d BLE devices", seen)
+            _LOGGER.debug("All BLE devices: %s", all_devices)
             return self.async_abort(reason="no_devices_found")
 
         return self.async_show_form(
-            step_id="user",
+            step_id="radiators",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_ADDRESSES): cv.multi_select(
+                        self._discovered_devices
+                    ),
+                }
+            ),
+            errors=errors,
+        )
+
+    async def async_step_import(self, import_data: dict[str, Any]) -> FlowResult:
+        """Create the entry of a device selected together with others."""
+        address = import_data[CONF_ADDRESS]
+        await self.async_set_unique_id(address, raise_on_progress=False)
+        self._abort_if_unique_id_configured()
+        return self.async_create_entry(
+            title=import_data[CONF_NAME], data={CONF_ADDRESS: address}
+        )
+
+
+class OptionsFlowHandler(config_entries.OptionsFlow):
+    """Handle Terma MOA Blue options."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the options."""
+        if self.config_entry.data.get(CONF_ENTRY_TYPE) == ENTRY_TYPE_CONTROLLER:
+            return await self.async_step_controller()
+        if user_input is not None:
+            self._async_share_adapter_concurrency(
+                user_input[CONF_ADAPTER_CONCURRENCY]
+            )
+            return self.async_create_entry(title="", data=user_input)
+
+        options = self.config_entry.options
+        return self.async_show_form(
+            step_id="init",
             data_schema=vol.Schema(
                 {
-                    vol.Required(CONF_ADDRESS): vol.In(self._discovered_devices),
+                    vol.Optional(
+                        CONF_SESSION_LINGER,
+                        default=options.get(
+                            CONF_SESSION_LINGER, DEFAULT_SESSION_LINGER
+                        ),
+                    ): vol.All(
+                        vol.Coerce(float), vol.Range(min=0, max=MAX_SESSION_LINGER)
+                    ),
+                    vol.Optional(
+                        CONF_ADAPTER_CONCURRENCY,
+                        default=options.get(
+                            CONF_ADAPTER_CONCURRENCY, DEFAULT_ADAPTER_CONCURRENCY
+                        ),
+                    ): vol.All(
+                        vol.Coerce(int), vol.Range(min=1, max=MAX_ADAPTER_CONCURRENCY)
+                    ),
+                    vol.Optional(
+                        CONF_POLL_FLOOR,
+                        default=options.get(CONF_POLL_FLOOR, DEFAULT_POLL_FLOOR),
+                    ): vol.All(
+                        vol.Coerce(int),
+                        vol.Range(min=MIN_POLL_INTERVAL, max=MAX_POLL_INTERVAL),
+                    ),
+                    vol.Optional(
+                        CONF_POLL_CEILING,
+                        default=options.get(CONF_POLL_CEILING, DEFAULT_POLL_CEILING),
+                    ): vol.All(
+                        vol.Coerce(int),
+                        vol.Range(min=MIN_POLL_INTERVAL, max=MAX_POLL_INTERVAL),
+                    ),
+                    vol.Optional(
+                        CONF_WRITE_DEBOUNCE,
+                        default=options.get(
+                            CONF_WRITE_DEBOUNCE, DEFAULT_WRITE_DEBOUNCE
+                        ),
+                    ): vol.All(
+                        vol.Coerce(float), vol.Range(min=0, max=MAX_WRITE_DEBOUNCE)
+                    ),
+                    vol.Optional(
+                        CONF_REAPPLY_DESIRED,
+                        default=options.get(
+                            CONF_REAPPLY_DESIRED, DEFAULT_REAPPLY_DESIRED
+                        ),
+                    ): bool,
+                    vol.Optional(
+                        CONF_FLEET_POLLING,
+                        default=options.get(CONF_FLEET_POLLING, DEFAULT_FLEET_POLLING),
+                    ): bool,
+                    vol.Optional(
+                        CONF_PIPELINE_READS,
+                        default=options.get(
+                            CONF_PIPELINE_READS, DEFAULT_PIPELINE_READS
+                        ),
+                    ): bool,
+                    vol.Optional(
+                        CONF_STATE_DEADBAND,
+                        default=options.get(
+                            CONF_STATE_DEADBAND, DEFAULT_STATE_DEADBAND
+                        ),
+                    ): vol.All(
+                        vol.Coerce(float), vol.Range(min=0, max=MAX_STATE_DEADBAND)
+                    ),
                 }
             ),
         )
+
+    @callback
+    def _async_share_adapter_concurrency(self, concurrency: int) -> None:
+        """Copy the adapter concurrency to the other radiators.
+
+        The scheduler slots are shared by all radiators on an adapter, so
+        the limit is one setting for the whole integration.
+        """
+        for entry in self.hass.config_entries.async_entries(DOMAIN):
+            if (
+                entry.entry_id == self.config_entry.entry_id
+                or entry.data.get(CONF_ENTRY_TYPE) == ENTRY_TYPE_CONTROLLER
+                or entry.options.get(CONF_ADAPTER_CONCURRENCY) == concurrency
+            ):
+                continue
+            self.hass.config_entries.async_update_entry(
+                entry, options={**entry.options, CONF_ADAPTER_CONCURRENCY: concurrency}
+            )
+
+    async def async_step_controller(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the options of a thermostat controller."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        return self.async_show_form(
+            step_id="controller",
+            data_schema=vol.Schema(
+                _controller_options_schema(self.config_entry.options)
+            ),
+        )
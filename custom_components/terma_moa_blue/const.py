@@ -3,24 +3,91 @@ from enum import IntEnum
 
 DOMAIN = "terma_moa_blue"
 
+# Keys in hass.data[DOMAIN] shared by all config entries
+DATA_BOND_STORE = "bond_store"
+DATA_FLEET = "fleet"
+DATA_ROUTER = "router"
+DATA_STATE_STORE = "state_store"
+DATA_WARMUP = "warmup"
+
 # BLE Service and Characteristics UUIDs
 SERVICE_UUID = "d97352b0-d19e-11e2-9e96-0800200c9a66"
 CHAR_ROOM_TEMP = "d97352b1-d19e-11e2-9e96-0800200c9a66"
 CHAR_ELEMENT_TEMP = "d97352b2-d19e-11e2-9e96-0800200c9a66"
 CHAR_MODE = "d97352b3-d19e-11e2-9e96-0800200c9a66"
 
+# Config flow: several devices selected at once
+CONF_ADDRESSES = "addresses"
+
+# Config entries are radiators, or thermostat controllers driving radiators
+CONF_ENTRY_TYPE = "entry_type"
+ENTRY_TYPE_CONTROLLER = "controller"
+CONF_TEMPERATURE_SENSOR = "temperature_sensor"
+CONF_RADIATORS = "radiators"
+CONF_HYSTERESIS = "hysteresis"
+DEFAULT_HYSTERESIS = 1.0  # °C below the setpoint before heating starts
+MAX_HYSTERESIS = 5.0
+CONF_HEATING_ELEMENT_TEMP = "heating_element_temperature"
+DEFAULT_HEATING_ELEMENT_TEMP = 50.0  # °C element setpoint while the controller heats
+CONF_MIN_DWELL = "min_dwell"
+DEFAULT_MIN_DWELL = 300  # seconds radiators stay on/off before switching again
+MAX_MIN_DWELL = 3600
+DEFAULT_CONTROLLER_SETPOINT = 22.0
+
 # Default pairing code
 DEFAULT_PAIRING_CODE = "123456"
 
 # Update intervals
 UPDATE_INTERVAL = 300  # 5 minutes - reduced BT adapter load - heating elements need longer pause between connections
 
+# Options
+CONF_SESSION_LINGER = "session_linger"
+DEFAULT_SESSION_LINGER = 5.0  # seconds an idle connection stays open for follow-up operations
+MAX_SESSION_LINGER = 60.0
+CONF_ADAPTER_CONCURRENCY = "adapter_concurrency"
+DEFAULT_ADAPTER_CONCURRENCY = 1  # parallel connections per Bluetooth adapter/proxy
+MAX_ADAPTER_CONCURRENCY = 5
+CONF_POLL_FLOOR = "poll_floor"
+DEFAULT_POLL_FLOOR = 60  # seconds - fastest poll while heating toward target
+CONF_POLL_CEILING = "poll_ceiling"
+DEFAULT_POLL_CEILING = 1800  # seconds - slowest poll while stable or off
+MIN_POLL_INTERVAL = 30
+CONF_WRITE_DEBOUNCE = "write_debounce"
+DEFAULT_WRITE_DEBOUNCE = 1.0  # seconds setpoint writes wait for further changes
+MAX_WRITE_DEBOUNCE = 10.0
+CONF_REAPPLY_DESIRED = "reapply_desired"
+DEFAULT_REAPPLY_DESIRED = False  # re-apply HA settings changed on the radiator itself
+CONF_FLEET_POLLING = "fleet_polling"
+DEFAULT_FLEET_POLLING = False  # poll via the shared fleet sweep instead of own timer
+MAX_POLL_INTERVAL = 7200
+CONF_PIPELINE_READS = "pipeline_reads"
+DEFAULT_PIPELINE_READS = False  # overlap the reads of a poll on one connection
+CONF_STATE_DEADBAND = "state_deadband"
+DEFAULT_STATE_DEADBAND = 0.0  # °C measured temperatures must move to update entities
+MAX_STATE_DEADBAND = 2.0
+
+# Upper bound for cancelling a device's operations and disconnecting on unload
+SHUTDOWN_TIMEOUT = 5.0  # seconds
+
+# Freshness of cached characteristic values - younger values are not read again
+READ_TTL_MODE = 0  # seconds - every poll, catches changes made on the radiator
+READ_TTL_ELEMENT = 900  # seconds - while the element is on it is read every poll
+# The room characteristic carries the measured room temperature as well, so it
+# is read every poll (TTL below MIN_POLL_INTERVAL) and only skipped right after
+# a write read it back
+READ_TTL_ROOM = 15  # seconds
+
 # Temperature limits
 MIN_ROOM_TEMP = 15
 MAX_ROOM_TEMP = 30
 MIN_ELEMENT_TEMP = 30
 MAX_ELEMENT_TEMP = 60
 
+# Services
+SERVICE_APPLY = "apply"
+ATTR_ROOM_TEMPERATURE = "room_temperature"
+ATTR_ELEMENT_TEMPERATURE = "element_temperature"
+
 
 class OperatingMode(IntEnum):
     """Operating modes for Terma MOA Blue."""
@@ -35,3 +102,11 @@ class OperatingMode(IntEnum):
     ELEMENT_TEMP_MANUAL = 6
     ROOM_TEMP_SCHEDULE = 7
     ELEMENT_TEMP_SCHEDULE = 8
+
+
+class OperationPriority(IntEnum):
+    """Priority lanes of queued BLE operations (lower runs first)."""
+
+    INTERACTIVE = 0  # user-initiated writes
+    VERIFY = 1  # poll confirming a write, and re-applying drifted state
+    POLL = 2  # scheduled background polls
@@ -0,0 +1,280 @@
+"""Hysteresis thermostat driving a group of Terma MOA Blue radiators."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any
+
+from homeassistant.components.climate import (
+    ClimateEntity,
+    ClimateEntityFeature,
+    HVACAction,
+    HVACMode,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import (
+    ATTR_TEMPERATURE,
+    STATE_UNAVAILABLE,
+    STATE_UNKNOWN,
+    UnitOfTemperature,
+)
+from homeassistant.core import CALLBACK_TYPE, Event, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import async_call_later, async_track_state_change_event
+from homeassistant.helpers.restore_state import RestoreEntity
+
+from .const import (
+    CONF_HEATING_ELEMENT_TEMP,
+    CONF_HYSTERESIS,
+    CONF_MIN_DWELL,
+    CONF_RADIATORS,
+    CONF_TEMPERATURE_SENSOR,
+    DEFAULT_CONTROLLER_SETPOINT,
+    DEFAULT_HEATING_ELEMENT_TEMP,
+    DEFAULT_HYSTERESIS,
+    DEFAULT_MIN_DWELL,
+    DOMAIN,
+    MAX_ROOM_TEMP,
+    MIN_ROOM_TEMP,
+    OperatingMode,
+)
+from .coordinator import TermaMoaBlueCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+ATTR_HEATING = "heating"
+ATTR_RADIATORS = "radiators"
+
+
+class TermaMoaBlueThermostatController(ClimateEntity, RestoreEntity):
+    """Room thermostat switching radiators by an external temperature sensor.
+
+    Heating starts when the room drops below setpoint - hysteresis and stops
+    when it reaches the setpoint. The radiators then get the target state
+    (on with the heating element temperature, or off) via apply, which
+    writes only what differs from each radiator's state, in one session per
+    radiator, all radiators concurrently. After a switch the radiators stay
+    on/off for at least min_dwell seconds; switching the controller off
+    turns them off right away.
+    """
+
+    _attr_should_poll = False
+    _attr_temperature_unit = UnitOfTemperature.CELSIUS
+    _attr_supported_features = (
+        ClimateEntityFeature.TARGET_TEMPERATURE | ClimateEntityFeature.TURN_OFF
+    )
+    _attr_hvac_modes = [HVACMode.OFF, HVACMode.HEAT]
+    _attr_min_temp = MIN_ROOM_TEMP
+    _attr_max_temp = MAX_ROOM_TEMP
+    _attr_target_temperature_step = 0.5
+
+    def __init__(self, entry: ConfigEntry) -> None:
+        """Initialize the controller."""
+        self._entry = entry
+        self._sensor: str = entry.data[CONF_TEMPERATURE_SENSOR]
+        self._radiators: list[str] = entry.data[CONF_RADIATORS]
+        options = entry.options
+        self._hysteresis: float = options.get(CONF_HYSTERESIS, DEFAULT_HYSTERESIS)
+        self._element_temp: float = options.get(
+            CONF_HEATING_ELEMENT_TEMP, DEFAULT_HEATING_ELEMENT_TEMP
+        )
+        self._min_dwell: float = options.get(CONF_MIN_DWELL, DEFAULT_MIN_DWELL)
+
+        self._attr_name = entry.title
+        self._attr_unique_id = entry.entry_id
+        self._attr_hvac_mode = HVACMode.OFF
+        self._attr_target_temperature = DEFAULT_CONTROLLER_SETPOINT
+        self._heating = False
+        self._last_switch: float | None = None
+        self._control_lock = asyncio.Lock()
+        self._unsub_dwell: CALLBACK_TYPE | None = None
+
+    @property
+    def hvac_action(self) -> HVACAction:
+        """Return whether the radiators are heating."""
+        if self._attr_hvac_mode == HVACMode.OFF:
+            return HVACAction.OFF
+        return HVACAction.HEATING if self._heating else HVACAction.IDLE
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return additional state attributes."""
+        return {ATTR_HEATING: self._heating, ATTR_RADIATORS: self._radiators}
+
+    async def async_added_to_hass(self) -> None:
+        """Restore the last state and follow the temperature sensor."""
+        await super().async_added_to_hass()
+        if (last_state := await self.async_get_last_state()) is not None:
+            if last_state.state in (HVACMode.OFF, HVACMode.HEAT):
+                self._attr_hvac_mode = HVACMode(last_state.state)
+            if (target := last_state.attributes.get(ATTR_TEMPERATURE)) is not None:
+                self._attr_target_temperature = float(target)
+            self._heating = bool(last_state.attributes.get(ATTR_HEATING, False))
+
+        self.async_on_remove(
+            async_track_state_change_event(
+                self.hass, [self._sensor], self._async_sensor_changed
+            )
+        )
+        self.async_on_remove(self._cancel_dwell_timer)
+        self._update_current_temperature()
+        # Bring the radiators in line after a restart, but leave them alone
+        # while the controller is off. In the background: the writes can
+        # take as long as the retry deadline and must not hold up setup.
+        self.hass.async_create_task(
+            self._async_control(force=self._attr_hvac_mode == HVACMode.HEAT)
+        )
+
+    @callback
+    def _cancel_dwell_timer(self) -> None:
+        """Cancel a pending re-evaluation after the dwell time."""
+        if self._unsub_dwell is not None:
+            self._unsub_dwell()
+            self._unsub_dwell = None
+
+    def _update_current_temperature(self) -> None:
+        """Read the room temperature from the sensor."""
+        state = self.hass.states.get(self._sensor)
+        if state is None or state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+            self._attr_current_temperature = None
+            return
+        try:
+            self._attr_current_temperature = float(state.state)
+        except ValueError:
+            _LOGGER.warning(
+                "Invalid temperature %s from %s", state.state, self._sensor
+            )
+            self._attr_current_temperature = None
+
+    @callback
+    def _async_sensor_changed(self, event: Event) -> None:
+        """Re-evaluate when the room temperature changes."""
+        self._update_current_temperature()
+        self.async_write_ha_state()
+        self.hass.async_create_task(self._async_control())
+
+    async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
+        """Switch the controller on or off."""
+        self._attr_hvac_mode = hvac_mode
+        await self._async_control(force=True)
+
+    async def async_set_temperature(self, **kwargs: Any) -> None:
+        """Set the room setpoint."""
+        if (temperature := kwargs.get(ATTR_TEMPERATURE)) is None:
+            return
+        self._attr_target_temperature = temperature
+        await self._async_control()
+
+    async def async_apply(self, **kwargs: Any) -> None:
+        """Reject the apply service, which targets single radiators."""
+        raise HomeAssistantError(
+            f"{self.entity_id} is a thermostat controller; use climate services"
+            " to control it, or apply to the radiators themselves"
+        )
+
+    def _want_heating(self) -> bool:
+        """Return whether the radiators should heat, with hysteresis."""
+        if self._attr_hvac_mode == HVACMode.OFF:
+            return False
+        current = self._attr_current_temperature
+        target = self._attr_target_temperature
+        if current is None or target is None:
+            # No reading - keep the radiators as they are
+            return self._heating
+        if self._heating:
+            return current < target
+        return current < target - self._hysteresis
+
+    async def _async_control(self, force: bool = False) -> None:
+        """Switch the radiators when the room temperature calls for it.
+
+        Radiators are only driven when the heating state changes, or with
+        force (mode change, start), so changes made on a radiator itself
+        are left alone in between. The dwell time only holds back
+        automatic switching, not switching the controller off.
+        """
+        async with self._control_lock:
+            heating = self._want_heating()
+            remaining = (
+                self._last_switch + self._min_dwell - time.monotonic()
+                if self._last_switch is not None
+                else 0
+            )
+            if (
+                heating != self._heating
+                and self._attr_hvac_mode == HVACMode.HEAT
+                and remaining > 0
+            ):
+                _LOGGER.debug(
+                    "%s: switching %s in %.0fs (minimum dwell)",
+                    self.entity_id,
+                    "on" if heating else "off",
+                    remaining,
+                )
+                self._cancel_dwell_timer()
+                self._unsub_dwell = async_call_later(
+                    self.hass, remaining, self._async_dwell_elapsed
+                )
+                self.async_write_ha_state()
+                return
+
+            changed = heating != self._heating
+            if changed:
+                self._heating = heating
+                self._last_switch = time.monotonic()
+                self._cancel_dwell_timer()
+            self.async_write_ha_state()
+            if changed or force:
+                await self._async_drive_radiators(heating)
+
+    @callback
+    def _async_dwell_elapsed(self, _now: Any) -> None:
+        """Re-evaluate once the dwell time has passed."""
+        self._unsub_dwell = None
+        self.hass.async_create_task(self._async_control())
+
+    def _coordinators(self) -> list[TermaMoaBlueCoordinator]:
+        """Return the coordinators of the loaded radiators of the group."""
+        coordinators = []
+        for address in self._radiators:
+            entry = self.hass.config_entries.async_entry_for_domain_unique_id(
+                DOMAIN, address
+            )
+            coordinator = (
+                self.hass.data.get(DOMAIN, {}).get(entry.entry_id) if entry else None
+            )
+            if coordinator is None:
+                _LOGGER.debug("%s: radiator %s is not loaded", self.entity_id, address)
+                continue
+            coordinators.append(coordinator)
+        return coordinators
+
+    async def _async_drive_radiators(self, heating: bool) -> None:
+        """Apply the target state to all radiators of the group."""
+        coordinators = self._coordinators()
+        results = await asyncio.gather(
+            *(self._async_drive(coordinator, heating) for coordinator in coordinators),
+            return_exceptions=True,
+        )
+        for coordinator, result in zip(coordinators, results):
+            if isinstance(result, Exception):
+                _LOGGER.error(
+                    "%s: failed to switch %s %s: %s",
+                    self.entity_id,
+                    coordinator.device.address,
+                    "on" if heating else "off",
+                    result,
+                )
+
+    async def _async_drive(
+        self, coordinator: TermaMoaBlueCoordinator, heating: bool
+    ) -> None:
+        """Apply the target state to one radiator; no-op fields are not written."""
+        if heating:
+            await coordinator.device.apply(
+                mode=OperatingMode.ON, element_temperature=self._element_temp
+            )
+        else:
+            await coordinator.device.apply(mode=OperatingMode.OFF)
+        coordinator.async_set_updated_data(coordinator.device.snapshot())
@@ -7,27 +7,73 @@ import random
 
 from bleak.backends.device import BLEDevice
 
-from homeassistant.core import HomeAssistant
+from homeassistant.components import bluetooth
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_ADDRESS
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .api import TermaMoaBlueDevice
-from .const import DOMAIN, UPDATE_INTERVAL
+from .api import DeviceSnapshot, TermaMoaBlueDevice
+from .bonds import TermaMoaBlueBondStore
+from .const import (
+    CONF_POLL_CEILING,
+    CONF_PIPELINE_READS,
+    CONF_POLL_FLOOR,
+    CONF_REAPPLY_DESIRED,
+    CONF_SESSION_LINGER,
+    CONF_STATE_DEADBAND,
+    CONF_WRITE_DEBOUNCE,
+    DEFAULT_POLL_CEILING,
+    DEFAULT_PIPELINE_READS,
+    DEFAULT_POLL_FLOOR,
+    DEFAULT_REAPPLY_DESIRED,
+    DEFAULT_SESSION_LINGER,
+    DEFAULT_STATE_DEADBAND,
+    DEFAULT_WRITE_DEBOUNCE,
+    DOMAIN,
+    UPDATE_INTERVAL,
+    OperationPriority,
+)
+from .fleet import FleetPollScheduler
+from .polling import AdaptivePollPolicy
+from .routing import ConnectionRouter
+from .state_store import TermaMoaBlueStateStore
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class TermaMoaBlueCoordinator(DataUpdateCoordinator[None]):
+class TermaMoaBlueCoordinator(DataUpdateCoordinator[DeviceSnapshot]):
     """Class to manage fetching Terma MOA Blue data."""
 
-    def __init__(self, hass: HomeAssistant, ble_device: BLEDevice) -> None:
-        """Initialize the coordinator."""
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        ble_device: BLEDevice | None,
+        bond_store: TermaMoaBlueBondStore | None = None,
+        fleet: FleetPollScheduler | None = None,
+        state_store: TermaMoaBlueStateStore | None = None,
+        router: ConnectionRouter | None = None,
+    ) -> None:
+        """Initialize the coordinator.
+
+        With a fleet scheduler the coordinator has no timer of its own and
+        is polled by the fleet's sweeps instead. With a state store the
+        device starts from its last-known state, and every state read from
+        the device is saved back to the store. With a router, connections
+        go through the best of the adapters and proxies reaching the device.
+
+        Without a BLEDevice (radiator not seen since start) the entities show
+        the stored state and polls are skipped until it advertises.
+        """
+        address = entry.data[CONF_ADDRESS].upper()
         # Add 0-60s random jitter to interval to prevent update cycles from synchronizing
         jitter = random.randint(0, 60)
         interval_with_jitter = UPDATE_INTERVAL + jitter
         
         _LOGGER.debug(
             "Initializing coordinator for %s with interval %ds (base %ds + jitter %ds)",
-            ble_device.address,
+            address,
             interval_with_jitter,
             UPDATE_INTERVAL,
             jitter,
@@ -37,18 +83,161 @@ class TermaMoaBlueCoordinator(DataUpdateCoordinator[None]):
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=interval_with_jitter),
+            update_interval=(
+                None if fleet else timedelta(seconds=interval_with_jitter)
+            ),
+        )
+        # Options the coordinator was built with, to tell what a change needs
+        self.options = dict(entry.options)
+        self.device = TermaMoaBlueDevice(
+            ble_device,
+            address=address,
+            session_linger=entry.options.get(
+                CONF_SESSION_LINGER, DEFAULT_SESSION_LINGER
+            ),
+            bond_store=bond_store,
+            write_debounce=entry.options.get(
+                CONF_WRITE_DEBOUNCE, DEFAULT_WRITE_DEBOUNCE
+            ),
+            reapply_desired=entry.options.get(
+                CONF_REAPPLY_DESIRED, DEFAULT_REAPPLY_DESIRED
+            ),
+            pipeline_reads=entry.options.get(
+                CONF_PIPELINE_READS, DEFAULT_PIPELINE_READS
+            ),
+            router=router,
+        )
+        self.poll_policy = AdaptivePollPolicy(
+            floor=entry.options.get(CONF_POLL_FLOOR, DEFAULT_POLL_FLOOR),
+            ceiling=entry.options.get(CONF_POLL_CEILING, DEFAULT_POLL_CEILING),
+            initial=interval_with_jitter,
+        )
+
+        self._fleet = fleet
+        self._state_store = state_store
+        if state_store is not None and (
+            state := state_store.get(address)
+        ):
+            self.device.restore_state(state)
+        # Entities show the (restored) state until the first refresh
+        self.data = self.device.snapshot()
+        # Measured temperatures moving less than this do not update entities
+        self.state_deadband: float = entry.options.get(
+            CONF_STATE_DEADBAND, DEFAULT_STATE_DEADBAND
         )
-        self.device = TermaMoaBlueDevice(ble_device)
 
-    async def _async_update_data(self) -> None:
+        # The first poll after a write verifies it, ahead of routine polls
+        self._verify_pending = False
+
+        # Presence from advertisements - polls are skipped while absent
+        self._present = ble_device is not None
+        self._unsub_tracking: list[CALLBACK_TYPE] = [
+            bluetooth.async_register_callback(
+                hass,
+                self._async_handle_advertisement,
+                bluetooth.BluetoothCallbackMatcher(
+                    address=address, connectable=True
+                ),
+                bluetooth.BluetoothScanningMode.PASSIVE,
+            ),
+            bluetooth.async_track_unavailable(
+                hass,
+                self._async_handle_unavailable,
+                address,
+                connectable=True,
+            ),
+        ]
+        if fleet is not None:
+            self._unsub_tracking.append(fleet.async_register(self))
+
+    def _set_poll_interval(self, seconds: float) -> None:
+        """Schedule the next own poll, or let the fleet re-plan its sweep."""
+        if self._fleet is None:
+            self.update_interval = timedelta(seconds=seconds)
+        else:
+            self._fleet.async_interval_changed(self)
+
+    @callback
+    def _async_handle_advertisement(
+        self,
+        service_info: bluetooth.BluetoothServiceInfoBleak,
+        change: bluetooth.BluetoothChange,
+    ) -> None:
+        """Keep the BLEDevice current and refresh when the device comes back."""
+        self.device.set_ble_device(service_info.device)
+        if self._present:
+            return
+        self._present = True
+        _LOGGER.debug("%s is advertising again, refreshing", self.device.address)
+        self.hass.async_create_task(self.async_request_refresh())
+
+    @callback
+    def _async_handle_unavailable(
+        self, service_info: bluetooth.BluetoothServiceInfoBleak
+    ) -> None:
+        """Stop polling a device that no longer advertises."""
+        _LOGGER.debug("%s stopped advertising", self.device.address)
+        self._present = False
+
+    async def _async_update_data(self) -> DeviceSnapshot:
         """Fetch data from the device."""
+        if not self._present:
+            # Don't spend connection attempts (and adapter slots) on a
+            # radiator that is powered off or out of range
+            if self.device.stale:
+                # Not seen since start - keep showing the stored state,
+                # flagged as stale, instead of turning the entities unavailable
+                return self.device.snapshot()
+            raise UpdateFailed(f"{self.device.address} is not advertising")
+
         try:
-            await self.device.update()
+            priority = (
+                OperationPriority.VERIFY
+                if self._verify_pending
+                else OperationPriority.POLL
+            )
+            snapshot = await self.device.update(priority)
+            self._verify_pending = False
         except Exception as err:
+            # Keeps the failed outcome for ordering the next warm-up
+            self._async_save_state()
             raise UpdateFailed(f"Error communicating with device: {err}") from err
 
+        self._async_save_state()
+
+        # The poll doubles as verification of earlier writes
+        try:
+            if await self.device.reconcile():
+                snapshot = self.device.snapshot()
+        except Exception as err:
+            _LOGGER.warning(
+                "Failed to re-apply desired state to %s: %s", self.device.address, err
+            )
+
+        self._set_poll_interval(self.poll_policy.next_interval(self.device))
+        return snapshot
+
+    @callback
+    def async_set_updated_data(self, data: DeviceSnapshot) -> None:
+        """Push state read back by a write and poll fast while it settles."""
+        self._verify_pending = True
+        self._set_poll_interval(self.poll_policy.reset())
+        self._async_save_state()
+        super().async_set_updated_data(data)
+
+    @callback
+    def _async_save_state(self) -> None:
+        """Persist the device state for the next start."""
+        if self._state_store is not None:
+            self._state_store.async_set(
+                self.device.address, self.device.state_as_dict()
+            )
+
     async def async_shutdown(self) -> None:
         """Shutdown the coordinator."""
-        # No persistent connection to close
-        pass
+        while self._unsub_tracking:
+            self._unsub_tracking.pop()()
+        # Cancel running and queued operations instead of letting them retry,
+        # so unloading does not wait for the radiator
+        await self.device.shutdown()
+        await super().async_shutdown()
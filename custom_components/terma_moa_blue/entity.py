@@ -0,0 +1,80 @@
+"""Base entity for Terma MOA Blue."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN
+from .coordinator import TermaMoaBlueCoordinator
+
+# Exact values and deadband-filtered measurements shown by an entity
+Projection = tuple[tuple[Any, ...], tuple[float | None, ...]]
+
+
+class TermaMoaBlueEntity(CoordinatorEntity[TermaMoaBlueCoordinator]):
+    """Entity writing its state only when its own part of it changed.
+
+    Each entity projects the coordinator snapshot onto the values it shows:
+    exact values (setpoints, mode, availability) update the entity on any
+    change, measured temperatures only when they moved more than the
+    configured deadband since the state last written.
+    """
+
+    _attr_has_entity_name = True
+
+    def __init__(self, coordinator: TermaMoaBlueCoordinator) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, coordinator.device.address)},
+            "name": coordinator.device.name,
+            "manufacturer": "Terma",
+            "model": "MOA Blue",
+        }
+        self._written: Projection | None = None
+
+    def _exact_projection(self) -> tuple[Any, ...]:
+        """Return the shown values that update the entity on any change."""
+        return ()
+
+    def _measured_projection(self) -> tuple[float | None, ...]:
+        """Return the shown measurements subject to the deadband."""
+        return ()
+
+    def _projection(self) -> Projection:
+        """Return the entity's projection of the coordinator state."""
+        return (
+            (self.available, *self._exact_projection()),
+            self._measured_projection(),
+        )
+
+    def _changed(self, projection: Projection) -> bool:
+        """Return True if the projection differs from the written state."""
+        if self._written is None:
+            return True
+        exact, measured = projection
+        written_exact, written_measured = self._written
+        if exact != written_exact:
+            return True
+        deadband = self.coordinator.state_deadband
+        return any(
+            (new is None) != (old is None)
+            or (new is not None and old is not None and abs(new - old) > deadband)
+            for new, old in zip(measured, written_measured)
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Record the state written when the entity is added."""
+        await super().async_added_to_hass()
+        self._written = self._projection()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only if the entity's projection changed."""
+        projection = self._projection()
+        if not self._changed(projection):
+            return
+        self._written = projection
+        self.async_write_ha_state()
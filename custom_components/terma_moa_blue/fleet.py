@@ -0,0 +1,181 @@
+"""Fleet-wide poll scheduling shared by all Terma MOA Blue entries."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .metrics import RollingHistogram
+from .scheduler import CONNECTION_SCHEDULER
+
+if TYPE_CHECKING:
+    from .coordinator import TermaMoaBlueCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_POLL_DURATION = 10.0  # seconds assumed for a device never polled by the fleet
+
+
+class FleetPollScheduler:
+    """Plan one poll sweep per cycle over all member coordinators.
+
+    Each cycle the due members (whose adaptive poll interval has elapsed)
+    are polled in address order, with their start times spread evenly over
+    the cycle. The cycle is as long as the shortest member interval, but
+    never shorter than the polls of the busiest adapter have recently been
+    taking, so polls neither bunch up nor queue for adapter slots at random.
+    A member whose interval drops below the cycle (a write to verify, the
+    radiator switched on) ends the sweep early, and the next one is planned
+    with the new interval. Results reach each entry's entities through its
+    coordinator.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self._members: dict[str, TermaMoaBlueCoordinator] = {}
+        self._durations: dict[str, RollingHistogram] = {}
+        self._last_poll: dict[str, float] = {}
+        self._polling: set[str] = set()  # members being polled right now
+        self._cycle: float | None = None  # length of the running sweep
+        self._planned: dict[str, float] = {}  # member intervals it was planned with
+        self._replan = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    @callback
+    def async_register(self, coordinator: TermaMoaBlueCoordinator) -> CALLBACK_TYPE:
+        """Add a coordinator to the sweep; returns a callback removing it."""
+        address = coordinator.device.address
+        self._members[address] = coordinator
+        self._durations.setdefault(address, RollingHistogram(size=20))
+        # Entry setup runs the first refresh itself
+        self._last_poll[address] = time.monotonic()
+        if self._task is None or self._task.done():
+            self._task = self.hass.async_create_background_task(
+                self._async_run(), "terma_moa_blue fleet poll"
+            )
+
+        @callback
+        def _unregister() -> None:
+            self._members.pop(address, None)
+            self._last_poll.pop(address, None)
+            if not self._members and self._task is not None:
+                self._task.cancel()
+                self._task = None
+
+        return _unregister
+
+    @callback
+    def async_interval_changed(self, coordinator: TermaMoaBlueCoordinator) -> None:
+        """Re-plan the sweep if a member now needs polling sooner than planned."""
+        interval = coordinator.poll_policy.interval
+        planned = self._planned.get(coordinator.device.address)
+        if (
+            self._cycle is not None
+            and planned is not None
+            and interval < min(planned, self._cycle)
+        ):
+            _LOGGER.debug(
+                "Poll interval of %s dropped to %.0fs, re-planning the sweep",
+                coordinator.device.address,
+                interval,
+            )
+            self._replan.set()
+
+    async def _async_wait(self, delay: float) -> bool:
+        """Sleep for delay seconds; return True if woken to re-plan."""
+        try:
+            async with asyncio.timeout(max(0.0, delay)):
+                await self._replan.wait()
+        except TimeoutError:
+            return False
+        self._replan.clear()
+        return True
+
+    def _expected_duration(self, address: str) -> float:
+        """Return how long a poll of the device is expected to take."""
+        return self._durations[address].p95 or DEFAULT_POLL_DURATION
+
+    def _plan(self, now: float) -> tuple[list[TermaMoaBlueCoordinator], float]:
+        """Return the members due this cycle and the cycle length."""
+        members = [self._members[address] for address in sorted(self._members)]
+        cycle = min(coord.poll_policy.interval for coord in members)
+
+        # Adapter time needed if every member were polled
+        busy: dict[str, float] = {}
+        for coord in members:
+            adapter = coord.device.adapter
+            busy[adapter] = busy.get(adapter, 0.0) + self._expected_duration(
+                coord.device.address
+            ) / CONNECTION_SCHEDULER.for_source(adapter).limit
+        cycle = max(cycle, *busy.values())
+
+        # Due if the interval elapses before the middle of this cycle
+        due = [
+            coord
+            for coord in members
+            if coord.device.address not in self._polling
+            and now - self._last_poll.get(coord.device.address, 0.0) + cycle / 2
+            >= coord.poll_policy.interval
+        ]
+        return due, cycle
+
+    async def _async_poll(self, coordinator: TermaMoaBlueCoordinator) -> None:
+        """Refresh one member and record how long it took."""
+        address = coordinator.device.address
+        started = time.monotonic()
+        self._polling.add(address)
+        try:
+            await coordinator.async_refresh()
+        finally:
+            self._polling.discard(address)
+        if address in self._members:
+            self._durations[address].add(time.monotonic() - started)
+            self._last_poll[address] = time.monotonic()
+
+    async def _async_run(self) -> None:
+        """Run poll sweeps while there are members."""
+        while self._members:
+            cycle_start = time.monotonic()
+            due, cycle = self._plan(cycle_start)
+            self._cycle = cycle
+            self._planned = {
+                address: coord.poll_policy.interval
+                for address, coord in self._members.items()
+            }
+            self._replan.clear()
+            spacing = cycle / max(len(due), 1)
+            _LOGGER.debug(
+                "Fleet sweep: %d of %d devices due, cycle %.0fs, spacing %.1fs",
+                len(due),
+                len(self._members),
+                cycle,
+                spacing,
+            )
+
+            polls: list[asyncio.Task[None]] = []
+            replan = False
+            for index, coordinator in enumerate(due):
+                if replan := await self._async_wait(
+                    cycle_start + index * spacing - time.monotonic()
+                ):
+                    break
+                if coordinator.device.address not in self._members:
+                    continue
+                polls.append(
+                    self.hass.async_create_background_task(
+                        self._async_poll(coordinator),
+                        f"terma_moa_blue fleet poll {coordinator.device.address}",
+                    )
+                )
+
+            if not replan:
+                replan = await self._async_wait(
+                    cycle_start + cycle - time.monotonic()
+                )
+            # Polls still running when re-planning go on; they are not due
+            if polls and not replan:
+                await asyncio.gather(*polls, return_exceptions=True)
@@ -0,0 +1,89 @@
+"""In-memory BLE operation metrics for Terma MOA Blue devices."""
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+import time
+
+HISTOGRAM_SIZE = 200  # samples kept per histogram
+
+
+class RollingHistogram:
+    """Keep the most recent samples of a value and report percentiles."""
+
+    __slots__ = ("_samples",)
+
+    def __init__(self, size: int = HISTOGRAM_SIZE) -> None:
+        """Initialize the histogram."""
+        self._samples: deque[float] = deque(maxlen=size)
+
+    def add(self, value: float) -> None:
+        """Record a sample."""
+        self._samples.append(value)
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        """Record the duration of the block in seconds."""
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self._samples.append(time.monotonic() - start)
+
+    @property
+    def count(self) -> int:
+        """Return number of samples kept."""
+        return len(self._samples)
+
+    def percentile(self, pct: float) -> float | None:
+        """Return the pct-th percentile (nearest rank), None without samples."""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        rank = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+        return ordered[rank]
+
+    @property
+    def p50(self) -> float | None:
+        """Return the median."""
+        return self.percentile(50)
+
+    @property
+    def p95(self) -> float | None:
+        """Return the 95th percentile."""
+        return self.percentile(95)
+
+    @property
+    def max(self) -> float | None:
+        """Return the largest sample."""
+        return max(self._samples, default=None)
+
+    def as_dict(self) -> dict[str, float | int | None]:
+        """Return a summary for state attributes."""
+        return {
+            "p50": _round(self.p50),
+            "p95": _round(self.p95),
+            "max": _round(self.max),
+            "samples": self.count,
+        }
+
+
+def _round(value: float | None) -> float | None:
+    """Round a duration for display."""
+    return None if value is None else round(value, 3)
+
+
+class DeviceMetrics:
+    """BLE operation metrics of one device."""
+
+    def __init__(self) -> None:
+        """Initialize the metrics."""
+        self.slot_wait = RollingHistogram()  # waiting for the adapter slot
+        self.connect = RollingHistogram()  # establish_connection
+        self.pair = RollingHistogram()  # client.pair()
+        self.read = RollingHistogram()  # each read_gatt_char
+        self.write = RollingHistogram()  # each write_gatt_char
+        self.attempts = RollingHistogram()  # attempts per operation
+        self.successes = 0
+        self.failures = 0
@@ -0,0 +1,111 @@
+"""Adaptive poll interval policy for Terma MOA Blue."""
+from __future__ import annotations
+
+from collections import deque
+import logging
+import time
+
+from .api import TermaMoaBlueDevice
+from .codec import raw_temperature
+from .const import OperatingMode, UPDATE_INTERVAL
+
+_LOGGER = logging.getLogger(__name__)
+
+BACKOFF_FACTOR = 2.0  # interval multiplier while nothing changes
+TARGET_TOLERANCE = 1.0  # °C - element counts as "at target" within this band
+CHANGE_THRESHOLD = 2  # 0.1°C units - a one-step wobble between polls counts as stable
+DAY = 86400.0
+
+
+class AdaptivePollPolicy:
+    """Choose the next poll interval from the observed device state.
+
+    Polls at the floor interval while the radiator is on and heats toward
+    its target or its state keeps changing, and backs off geometrically up
+    to the ceiling while values stay stable or the radiator is off.
+    """
+
+    def __init__(self, floor: float, ceiling: float, initial: float) -> None:
+        """Initialize the policy."""
+        self.floor = floor
+        self.ceiling = max(ceiling, floor)
+        self.interval = min(max(initial, self.floor), self.ceiling)
+        self._last: tuple[int | None, ...] | None = None
+        self._last_mode: OperatingMode | None = None
+        self._started = time.monotonic()
+        self._polls: deque[float] = deque()
+
+    def reset(self) -> float:
+        """Drop to the floor interval, e.g. after a write changed the state."""
+        self.interval = self.floor
+        self._last = None
+        self._last_mode = None
+        return self.interval
+
+    def next_interval(self, device: TermaMoaBlueDevice) -> float:
+        """Record a completed poll and return the interval until the next one."""
+        now = time.monotonic()
+        self._polls.append(now)
+        while self._polls and self._polls[0] < now - DAY:
+            self._polls.popleft()
+
+        # Compared in the protocol's units - float differences of one step
+        # fall either side of 0.1°C
+        state = tuple(
+            raw_temperature(value) if value is not None else None
+            for value in (
+                device.current_room_temp,
+                device.target_room_temp,
+                device.current_element_temp,
+                device.target_element_temp,
+            )
+        )
+        changed = self._last is not None and (
+            device.mode != self._last_mode
+            or any(
+                (old is None) != (new is None)
+                or (old is not None and abs(new - old) >= CHANGE_THRESHOLD)
+                for old, new in zip(self._last, state)
+            )
+        )
+        self._last = state
+        self._last_mode = device.mode
+
+        on = device.mode == OperatingMode.ON
+        heating = on and (
+            device.current_element_temp is None
+            or device.target_element_temp is None
+            or device.target_element_temp - device.current_element_temp
+            > TARGET_TOLERANCE
+        )
+
+        # A radiator that is off backs off even while it cools down
+        if on and (heating or changed):
+            self.interval = self.floor
+        else:
+            self.interval = min(self.interval * BACKOFF_FACTOR, self.ceiling)
+
+        _LOGGER.debug(
+            "Next poll of %s in %.0fs (heating=%s, changed=%s)",
+            device.address,
+            self.interval,
+            heating,
+            changed,
+        )
+        return self.interval
+
+    @property
+    def connections_saved_per_day(self) -> float | None:
+        """Return poll connections per day saved against the fixed interval.
+
+        Compares the polls of the last 24 hours (or the uptime, if shorter)
+        with the number a fixed UPDATE_INTERVAL would have made; negative
+        while the policy is polling faster than the fixed interval. None
+        until one UPDATE_INTERVAL has passed - scaling a shorter window to a
+        day would turn the first poll into thousands of extra connections.
+        """
+        window = min(time.monotonic() - self._started, DAY)
+        if window < UPDATE_INTERVAL:
+            return None
+        expected = window / UPDATE_INTERVAL
+        return round((expected - len(self._polls)) * DAY / window, 1)
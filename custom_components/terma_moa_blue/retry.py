@@ -0,0 +1,140 @@
+"""Retry policy and circuit breaker for Terma MOA Blue BLE operations."""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from enum import StrEnum
+import logging
+import random
+import time
+
+from bleak.exc import BleakError
+
+_LOGGER = logging.getLogger(__name__)
+
+# Connection settings
+MAX_CONNECT_ATTEMPTS = 5  # Increased from 3 to 5
+CONNECTION_TIMEOUT = 20.0  # Increased from 15 to 20 seconds
+OPERATION_DEADLINE = 60.0  # seconds - overall budget of one operation incl. retries
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 10.0
+
+# Circuit breaker settings
+FAILURE_THRESHOLD = 3  # failed operations in a row before the circuit opens
+COOLDOWN = 300.0  # seconds the circuit stays open before a trial operation
+
+# Errors caused by the radio link or the device, worth another attempt.
+# Anything else (TypeError, AttributeError, ...) is a bug and fails at once.
+RETRYABLE_ERRORS: tuple[type[BaseException], ...] = (
+    BleakError,
+    TimeoutError,
+    asyncio.TimeoutError,
+    EOFError,
+    OSError,
+)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How often and how long to retry a failed BLE operation."""
+
+    max_attempts: int = MAX_CONNECT_ATTEMPTS
+    deadline: float = OPERATION_DEADLINE
+    connect_timeout: float = CONNECTION_TIMEOUT
+    base_delay: float = RETRY_BASE_DELAY
+    max_delay: float = RETRY_MAX_DELAY
+    jitter: float = 0.5  # fraction of the delay randomized either way
+
+    def is_retryable(self, err: BaseException) -> bool:
+        """Return True if another attempt may succeed after this error."""
+        return isinstance(err, RETRYABLE_ERRORS)
+
+    def delay(self, attempt: int) -> float:
+        """Return the back-off before the attempt following attempt (0-based)."""
+        delay = min(self.max_delay, self.base_delay * 2**attempt)
+        return delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+
+class CircuitState(StrEnum):
+    """State of a per-device circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Fail fast for a device after repeated failed operations.
+
+    After failure_threshold failed operations in a row the circuit opens and
+    operations are refused for cooldown seconds. Then one trial operation is
+    let through (half-open) and further operations are refused until it is
+    done: success closes the circuit, failure re-opens it. A trial ending
+    without either (e.g. cancelled) lets the next operation try.
+    """
+
+    def __init__(
+        self, failure_threshold: int = FAILURE_THRESHOLD, cooldown: float = COOLDOWN
+    ) -> None:
+        """Initialize the breaker."""
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._trial = False  # a half-open trial operation is running
+
+    @property
+    def state(self) -> CircuitState:
+        """Return the current state."""
+        if self._opened_at is None:
+            return CircuitState.CLOSED
+        if time.monotonic() - self._opened_at >= self.cooldown:
+            return CircuitState.HALF_OPEN
+        return CircuitState.OPEN
+
+    @property
+    def retry_in(self) -> float:
+        """Return seconds until a trial operation is allowed."""
+        if self._opened_at is None:
+            return 0.0
+        return max(0.0, self._opened_at + self.cooldown - time.monotonic())
+
+    @property
+    def trial_running(self) -> bool:
+        """Return True while the half-open trial operation is running."""
+        return self._trial
+
+    def allow(self) -> bool:
+        """Return True if an operation may run now.
+
+        In the half-open state the first caller becomes the trial operation
+        and must end it with record_success, record_failure or end_trial.
+        """
+        state = self.state
+        if state is CircuitState.CLOSED:
+            return True
+        if state is CircuitState.OPEN or self._trial:
+            return False
+        _LOGGER.debug("Circuit half-open, letting a trial operation through")
+        self._trial = True
+        return True
+
+    def end_trial(self) -> None:
+        """End a trial operation that neither succeeded nor failed."""
+        self._trial = False
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful operation."""
+        if self._opened_at is not None:
+            _LOGGER.debug("Circuit closed")
+        self._failures = 0
+        self._opened_at = None
+        self._trial = False
+
+    def record_failure(self) -> None:
+        """Count a failed operation, opening the circuit at the threshold."""
+        self._failures += 1
+        self._trial = False
+        if self.state is CircuitState.HALF_OPEN or self._failures >= self.failure_threshold:
+            self._opened_at = time.monotonic()
+            _LOGGER.debug("Circuit opened after %d failures", self._failures)
@@ -0,0 +1,119 @@
+"""Connection path selection across Bluetooth adapters and proxies."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+import logging
+from typing import Protocol
+
+from bleak.backends.device import BLEDevice
+
+from homeassistant.components import bluetooth
+from homeassistant.core import HomeAssistant
+
+from .scheduler import CONNECTION_SCHEDULER
+
+_LOGGER = logging.getLogger(__name__)
+
+NO_RSSI = -127
+
+
+@dataclass(slots=True)
+class ConnectionPath:
+    """One adapter or proxy able to connect to a device."""
+
+    source: str
+    ble_device: BLEDevice
+    rssi: int
+    free_slots: int | None = None  # None if the scanner does not report slots
+
+
+class ScannerRegistry(Protocol):
+    """Source of the connection paths to an address."""
+
+    def paths(self, address: str) -> list[ConnectionPath]:
+        """Return the connectable paths to an address."""
+
+
+class HaScannerRegistry:
+    """Connection paths from Home Assistant's connectable scanners."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the registry."""
+        self.hass = hass
+
+    def _free_slots(self, source: str) -> int | None:
+        """Return the free connection slots of a scanner, if reported."""
+        # Slot allocations are only available in newer Home Assistant versions
+        current_allocations = getattr(bluetooth, "async_current_allocations", None)
+        if current_allocations is None:
+            return None
+        if allocations := current_allocations(self.hass, source):
+            return allocations[0].free
+        return None
+
+    def paths(self, address: str) -> list[ConnectionPath]:
+        """Return the connectable paths to an address."""
+        return [
+            ConnectionPath(
+                source=device.scanner.source,
+                ble_device=device.ble_device,
+                rssi=device.advertisement.rssi or NO_RSSI,
+                free_slots=self._free_slots(device.scanner.source),
+            )
+            for device in bluetooth.async_scanner_devices_by_address(
+                self.hass, address, connectable=True
+            )
+        ]
+
+
+class ConnectionRouter:
+    """Order the connection paths to try for a device.
+
+    Paths with a free connection slot go first, then the path that last
+    worked for the device, then by signal strength. Scanners that do not
+    report slots are judged by this integration's own connections through
+    them. Paths without free slots are kept as a last resort.
+    """
+
+    def __init__(self, registry: ScannerRegistry) -> None:
+        """Initialize the router."""
+        self._registry = registry
+        self._working: dict[str, str] = {}
+
+    def _has_free_slot(self, path: ConnectionPath) -> bool:
+        """Return True if a connection through the path can start now."""
+        if path.free_slots is not None:
+            return path.free_slots > 0
+        scheduler = CONNECTION_SCHEDULER.for_source(path.source)
+        return scheduler.active < scheduler.limit
+
+    def plan(self, address: str) -> list[ConnectionPath]:
+        """Return the paths to an address, best first."""
+        working = self._working.get(address)
+        paths = sorted(
+            self._registry.paths(address),
+            key=lambda path: (
+                not self._has_free_slot(path),
+                path.source != working,
+                -path.rssi,
+            ),
+        )
+        if len(paths) > 1:
+            _LOGGER.debug(
+                "Connection paths to %s: %s",
+                address,
+                ", ".join(
+                    f"{path.source} ({path.rssi} dBm, {path.free_slots} free)"
+                    for path in paths
+                ),
+            )
+        return paths
+
+    def record_success(self, address: str, source: str) -> None:
+        """Remember the path that worked for an address."""
+        self._working[address] = source
+
+    def record_failure(self, address: str, source: str) -> None:
+        """Forget the working path of an address if it failed."""
+        if self._working.get(address) == source:
+            del self._working[address]
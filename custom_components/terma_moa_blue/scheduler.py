@@ -0,0 +1,198 @@
+"""Per-adapter BLE connection scheduler for Terma MOA Blue."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+import heapq
+import itertools
+import logging
+
+from bleak.backends.device import BLEDevice
+
+from .const import DEFAULT_ADAPTER_CONCURRENCY, OperationPriority
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_SOURCE = "default"
+
+
+def adapter_source(ble_device: BLEDevice) -> str:
+    """Return the adapter or proxy used to reach a device.
+
+    Home Assistant puts the scanner source into BLEDevice.details; for
+    BlueZ devices without it the adapter name is taken from the D-Bus path
+    (/org/bluez/hci0/dev_...).
+    """
+    details = ble_device.details
+    if isinstance(details, dict):
+        if source := details.get("source"):
+            return str(source)
+        if path := details.get("path"):
+            parts = str(path).split("/")
+            if len(parts) > 3:
+                return parts[3]
+    return DEFAULT_SOURCE
+
+
+class SlotHandle:
+    """A connection slot held by one operation."""
+
+    __slots__ = ("_scheduler", "priority", "held")
+
+    def __init__(self, scheduler: AdapterScheduler, priority: OperationPriority) -> None:
+        """Initialize the handle."""
+        self._scheduler = scheduler
+        self.priority = priority
+        self.held = False
+
+    async def pause(self, delay: float) -> None:
+        """Sleep between retries, lending the slot to more urgent operations.
+
+        When an operation of a higher priority is queued, the slot is
+        released for the pause and re-acquired afterwards.
+        """
+        if not self._scheduler.has_waiter_before(self.priority):
+            await asyncio.sleep(delay)
+            return
+
+        _LOGGER.debug(
+            "Yielding %s slot to a higher priority operation", self._scheduler.source
+        )
+        self.held = False
+        self._scheduler.release()
+        await asyncio.sleep(delay)
+        await self._scheduler.acquire(self.priority)
+        self.held = True
+
+    @property
+    def source(self) -> str:
+        """Return the adapter the slot belongs to."""
+        return self._scheduler.source
+
+    async def transfer(self, scheduler: AdapterScheduler) -> None:
+        """Exchange the slot for one of another adapter, e.g. to fall back."""
+        if scheduler is self._scheduler:
+            return
+        if self.held:
+            self.held = False
+            self._scheduler.release()
+        self._scheduler = scheduler
+        await scheduler.acquire(self.priority)
+        self.held = True
+
+    def release(self) -> None:
+        """Release the slot if held."""
+        if self.held:
+            self.held = False
+            self._scheduler.release()
+
+
+class AdapterScheduler:
+    """Hand out connection slots of one adapter by priority, FIFO within a lane."""
+
+    def __init__(self, source: str, limit: int) -> None:
+        """Initialize the scheduler."""
+        self.source = source
+        self.limit = limit
+        self._active = 0
+        self._seq = itertools.count()
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+
+    @property
+    def active(self) -> int:
+        """Return number of slots in use."""
+        return self._active
+
+    @property
+    def waiting(self) -> int:
+        """Return number of operations queued for a slot."""
+        return sum(1 for _, _, fut in self._waiters if not fut.done())
+
+    def has_waiter_before(self, priority: OperationPriority) -> bool:
+        """Return True if an operation more urgent than priority is queued."""
+        return any(
+            prio < priority and not fut.done() for prio, _, fut in self._waiters
+        )
+
+    def set_limit(self, limit: int) -> None:
+        """Change the concurrency limit, waking queued operations if raised."""
+        self.limit = limit
+        self._wake_waiters()
+
+    async def acquire(self, priority: OperationPriority = OperationPriority.POLL) -> None:
+        """Wait for a free slot."""
+        if self._active < self.limit and not self.waiting:
+            self._active += 1
+            return
+
+        fut: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._seq), fut))
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                # Slot was handed over just before cancellation - pass it on
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """Release a slot, handing it to the most urgent, oldest operation."""
+        self._active -= 1
+        self._wake_waiters()
+
+    def _wake_waiters(self) -> None:
+        """Grant free slots to queued operations."""
+        while self._waiters and self._active < self.limit:
+            _, _, fut = heapq.heappop(self._waiters)
+            if fut.done():
+                continue
+            self._active += 1
+            fut.set_result(None)
+
+    @asynccontextmanager
+    async def slot(
+        self, priority: OperationPriority = OperationPriority.POLL
+    ) -> AsyncIterator[SlotHandle]:
+        """Hold a connection slot for the duration of the block."""
+        handle = SlotHandle(self, priority)
+        await self.acquire(priority)
+        handle.held = True
+        try:
+            yield handle
+        finally:
+            # The handle may have been transferred to another adapter
+            handle.release()
+
+
+class ConnectionScheduler:
+    """Registry of slot schedulers keyed by Bluetooth adapter/proxy source."""
+
+    def __init__(self, default_limit: int = DEFAULT_ADAPTER_CONCURRENCY) -> None:
+        """Initialize the registry."""
+        self.default_limit = default_limit
+        self._adapters: dict[str, AdapterScheduler] = {}
+
+    def set_limit(self, limit: int) -> None:
+        """Set the concurrency limit of all adapters, current and future."""
+        self.default_limit = limit
+        for scheduler in self._adapters.values():
+            if scheduler.limit != limit:
+                scheduler.set_limit(limit)
+
+    def for_source(self, source: str) -> AdapterScheduler:
+        """Return the scheduler of an adapter."""
+        if (scheduler := self._adapters.get(source)) is None:
+            scheduler = self._adapters[source] = AdapterScheduler(
+                source, self.default_limit
+            )
+            _LOGGER.debug(
+                "Created connection scheduler for %s (limit %d)",
+                source,
+                scheduler.limit,
+            )
+        return scheduler
+
+
+# Shared by all devices of the integration
+CONNECTION_SCHEDULER = ConnectionScheduler()
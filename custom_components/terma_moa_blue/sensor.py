@@ -4,6 +4,7 @@ from __future__ import annotations
 from collections.abc import Callable
 from dataclasses import dataclass
 import logging
+from typing import Any
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -12,13 +13,15 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import UnitOfTemperature
+from homeassistant.const import EntityCategory, UnitOfTemperature, UnitOfTime
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, OperatingMode
 from .coordinator import TermaMoaBlueCoordinator
+from .entity import TermaMoaBlueEntity
+from .metrics import DeviceMetrics, RollingHistogram
+from .retry import CircuitState
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -28,6 +31,36 @@ class TermaMoaBlueSensorEntityDescription(SensorEntityDescription):
     """Describes Terma MOA Blue sensor entity."""
 
     value_fn: Callable[[TermaMoaBlueCoordinator], float | str | None] = None
+    attrs_fn: Callable[[TermaMoaBlueCoordinator], dict[str, Any]] | None = None
+    # Measured value - only changes beyond the state deadband update the entity
+    deadband: bool = False
+
+
+def _stale_attrs(coord: TermaMoaBlueCoordinator) -> dict[str, Any]:
+    """Return whether the device state shown is the restored one of the last run."""
+    return {"stale": coord.data.stale}
+
+
+def _histogram_sensor(
+    key: str,
+    name: str,
+    histogram_fn: Callable[[DeviceMetrics], RollingHistogram],
+    unit: str | None = UnitOfTime.SECONDS,
+) -> TermaMoaBlueSensorEntityDescription:
+    """Describe a diagnostic sensor showing the p95 of a metrics histogram."""
+    return TermaMoaBlueSensorEntityDescription(
+        key=key,
+        name=name,
+        icon="mdi:timer-outline",
+        device_class=SensorDeviceClass.DURATION if unit else None,
+        native_unit_of_measurement=unit,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2 if unit else 1,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coord: histogram_fn(coord.device.metrics).p95,
+        attrs_fn=lambda coord: histogram_fn(coord.device.metrics).as_dict(),
+    )
 
 
 SENSORS: tuple[TermaMoaBlueSensorEntityDescription, ...] = (
@@ -37,7 +70,9 @@ SENSORS: tuple[TermaMoaBlueSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        value_fn=lambda coord: coord.device.current_room_temp,
+        value_fn=lambda coord: coord.data.current_room_temp,
+        attrs_fn=_stale_attrs,
+        deadband=True,
     ),
     TermaMoaBlueSensorEntityDescription(
         key="target_room_temperature",
@@ -45,7 +80,8 @@ SENSORS: tuple[TermaMoaBlueSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        value_fn=lambda coord: coord.device.target_room_temp,
+        value_fn=lambda coord: coord.data.target_room_temp,
+        attrs_fn=_stale_attrs,
     ),
     TermaMoaBlueSensorEntityDescription(
         key="current_element_temperature",
@@ -53,7 +89,9 @@ SENSORS: tuple[TermaMoaBlueSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        value_fn=lambda coord: coord.device.current_element_temp,
+        value_fn=lambda coord: coord.data.current_element_temp,
+        attrs_fn=_stale_attrs,
+        deadband=True,
     ),
     TermaMoaBlueSensorEntityDescription(
         key="target_element_temperature",
@@ -61,13 +99,124 @@ SENSORS: tuple[TermaMoaBlueSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        value_fn=lambda coord: coord.device.target_element_temp,
+        value_fn=lambda coord: coord.data.target_element_temp,
+        attrs_fn=_stale_attrs,
     ),
     TermaMoaBlueSensorEntityDescription(
         key="operating_mode",
         name="Operating Mode",
         icon="mdi:cog",
-        value_fn=lambda coord: coord.device.mode.name if coord.device.mode else None,
+        value_fn=lambda coord: coord.data.mode.name if coord.data.mode else None,
+        attrs_fn=_stale_attrs,
+    ),
+    TermaMoaBlueSensorEntityDescription(
+        key="pair_attempts_performed",
+        name="Pair Attempts Performed",
+        icon="mdi:bluetooth-connect",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coord: coord.device.pair_attempts_performed,
+    ),
+    TermaMoaBlueSensorEntityDescription(
+        key="pair_attempts_skipped",
+        name="Pair Attempts Skipped",
+        icon="mdi:bluetooth-connect",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coord: coord.device.pair_attempts_skipped,
+    ),
+    TermaMoaBlueSensorEntityDescription(
+        key="poll_interval",
+        name="Poll Interval",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coord: round(coord.poll_policy.interval),
+    ),
+    TermaMoaBlueSensorEntityDescription(
+        key="connections_saved_per_day",
+        name="Connections Saved Per Day",
+        icon="mdi:bluetooth-off",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coord: coord.poll_policy.connections_saved_per_day,
+    ),
+    TermaMoaBlueSensorEntityDescription(
+        key="connect_to_first_read",
+        name="Connect To First Read",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_display_precision=2,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coord: coord.device.connect_to_first_read,
+    ),
+    TermaMoaBlueSensorEntityDescription(
+        key="circuit_state",
+        name="Circuit State",
+        icon="mdi:electric-switch",
+        device_class=SensorDeviceClass.ENUM,
+        options=[state.value for state in CircuitState],
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coord: coord.device.circuit_breaker.state.value,
+    ),
+    _histogram_sensor("slot_wait_time", "Slot Wait Time", lambda m: m.slot_wait),
+    _histogram_sensor("connect_time", "Connect Time", lambda m: m.connect),
+    _histogram_sensor("pair_time", "Pair Time", lambda m: m.pair),
+    _histogram_sensor("gatt_read_time", "GATT Read Time", lambda m: m.read),
+    _histogram_sensor("gatt_write_time", "GATT Write Time", lambda m: m.write),
+    _histogram_sensor(
+        "attempts_per_operation", "Attempts Per Operation", lambda m: m.attempts, None
+    ),
+    TermaMoaBlueSensorEntityDescription(
+        key="successful_operations",
+        name="Successful Operations",
+        icon="mdi:check-circle-outline",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coord: coord.device.metrics.successes,
+    ),
+    TermaMoaBlueSensorEntityDescription(
+        key="writes_avoided",
+        name="Writes Avoided",
+        icon="mdi:content-save-off-outline",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coord: coord.device.writes_avoided,
+    ),
+    TermaMoaBlueSensorEntityDescription(
+        key="writes_superseded",
+        name="Writes Superseded",
+        icon="mdi:debug-step-over",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coord: coord.device.writes_superseded,
+    ),
+    TermaMoaBlueSensorEntityDescription(
+        key="reads_skipped",
+        name="Reads Skipped",
+        icon="mdi:eye-off-outline",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coord: coord.device.reads_skipped,
+    ),
+    TermaMoaBlueSensorEntityDescription(
+        key="failed_operations",
+        name="Failed Operations",
+        icon="mdi:alert-circle-outline",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coord: coord.device.metrics.failures,
     ),
 )
 
@@ -85,11 +234,10 @@ async def async_setup_entry(
     )
 
 
-class TermaMoaBlueSensor(CoordinatorEntity[TermaMoaBlueCoordinator], SensorEntity):
+class TermaMoaBlueSensor(TermaMoaBlueEntity, SensorEntity):
     """Representation of a Terma MOA Blue sensor."""
 
     entity_description: TermaMoaBlueSensorEntityDescription
-    _attr_has_entity_name = True
 
     def __init__(
         self,
@@ -101,14 +249,27 @@ class TermaMoaBlueSensor(CoordinatorEntity[TermaMoaBlueCoordinator], SensorEntit
         self.entity_description = description
 
         self._attr_unique_id = f"{coordinator.device.address}_{description.key}"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, coordinator.device.address)},
-            "name": coordinator.device.name,
-            "manufacturer": "Terma",
-            "model": "MOA Blue",
-        }
+
+    def _exact_projection(self) -> tuple[Any, ...]:
+        """Return the shown values that update the entity on any change."""
+        if self.entity_description.deadband:
+            return (self.extra_state_attributes,)
+        return (self.native_value, self.extra_state_attributes)
+
+    def _measured_projection(self) -> tuple[float | None, ...]:
+        """Return the shown measurements subject to the deadband."""
+        if self.entity_description.deadband:
+            return (self.native_value,)
+        return ()
 
     @property
     def native_value(self) -> float | str | None:
         """Return the state of the sensor."""
         return self.entity_description.value_fn(self.coordinator)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return additional state attributes."""
+        if self.entity_description.attrs_fn is None:
+            return None
+        return self.entity_description.attrs_fn(self.coordinator)
@@ -0,0 +1,54 @@
+"""Persistent last-known state of Terma MOA Blue devices."""
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_KEY = f"{DOMAIN}.state"
+STORAGE_VERSION = 1
+SAVE_DELAY = 60  # seconds - state changes often, the snapshot may lag a little
+
+
+class TermaMoaBlueStateStore:
+    """Remember the last decoded state of every device, across restarts.
+
+    Entries are set up from this snapshot right away, while the first real
+    refresh runs in the background.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the store."""
+        self._store: Store[dict[str, dict[str, Any]]] = Store(
+            hass, STORAGE_VERSION, STORAGE_KEY
+        )
+        self._states: dict[str, dict[str, Any]] = {}
+
+    async def async_load(self) -> None:
+        """Load states from storage."""
+        if (data := await self._store.async_load()) is not None:
+            self._states = data
+        _LOGGER.debug("Loaded last-known state of %d devices", len(self._states))
+
+    def get(self, address: str) -> dict[str, Any] | None:
+        """Return the last-known state of an address."""
+        return self._states.get(address)
+
+    @callback
+    def async_set(self, address: str, state: dict[str, Any]) -> None:
+        """Record the state of an address."""
+        if self._states.get(address) == state:
+            return
+        self._states[address] = state
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, dict[str, Any]]:
+        """Return data to persist."""
+        return self._states
@@ -0,0 +1,126 @@
+"""Staggered warm-up of Terma MOA Blue devices after Home Assistant start."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING
+
+from homeassistant.components import bluetooth
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .const import OperationPriority
+from .scheduler import CONNECTION_SCHEDULER
+
+if TYPE_CHECKING:
+    from .coordinator import TermaMoaBlueCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+COLLECT_DELAY = 2.0  # seconds to wait for the other entries set up at start
+WARMUP_GAP = 1.0  # seconds between the starts of two warm-up refreshes on one adapter
+WRITE_YIELD_INTERVAL = 0.5  # seconds between checks for queued user writes
+
+
+class WarmupQueue:
+    """Run the first refresh of all entries, adapter by adapter.
+
+    Entries added shortly after each other (as at Home Assistant start) are
+    collected into one batch. Within each adapter the most promising devices
+    go first: those whose last connection succeeded, then by the strongest
+    last-known RSSI, so a few unreachable radiators cannot hold up the rest.
+    Each adapter runs as many warm-up refreshes at once as it has connection
+    slots, starting them WARMUP_GAP apart, and waits while user writes are
+    queued for the adapter.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the queue."""
+        self.hass = hass
+        self._pending: dict[str, TermaMoaBlueCoordinator] = {}
+        self._task: asyncio.Task[None] | None = None
+
+    @callback
+    def async_add(self, coordinator: TermaMoaBlueCoordinator) -> CALLBACK_TYPE:
+        """Queue the first refresh of an entry; returns a callback dropping it."""
+        address = coordinator.device.address
+        self._pending[address] = coordinator
+        if self._task is None or self._task.done():
+            self._task = self.hass.async_create_background_task(
+                self._async_run(), "terma_moa_blue warm-up"
+            )
+
+        @callback
+        def _remove() -> None:
+            if self._pending.get(address) is coordinator:
+                del self._pending[address]
+
+        return _remove
+
+    def _rank(self, coordinator: TermaMoaBlueCoordinator) -> tuple[bool, int]:
+        """Return the sort key of a device; lower goes first."""
+        device = coordinator.device
+        rssi = -127
+        if service_info := bluetooth.async_last_service_info(
+            self.hass, device.address, connectable=True
+        ):
+            rssi = service_info.rssi
+        return (device.last_connect_ok is False, -rssi)
+
+    async def _async_run(self) -> None:
+        """Warm up batches until nothing is pending."""
+        while self._pending:
+            await asyncio.sleep(COLLECT_DELAY)
+            lanes: dict[str, list[TermaMoaBlueCoordinator]] = {}
+            for coordinator in sorted(self._pending.values(), key=self._rank):
+                lanes.setdefault(coordinator.device.adapter, []).append(coordinator)
+            _LOGGER.debug(
+                "Warming up %s",
+                ", ".join(
+                    f"{adapter}: {len(lane)} devices" for adapter, lane in lanes.items()
+                ),
+            )
+            await asyncio.gather(
+                *(self._async_run_lane(adapter, lane) for adapter, lane in lanes.items())
+            )
+
+    async def _async_run_lane(
+        self, adapter: str, coordinators: list[TermaMoaBlueCoordinator]
+    ) -> None:
+        """Refresh the devices of one adapter in order, up to its limit at once."""
+        scheduler = CONNECTION_SCHEDULER.for_source(adapter)
+        running: set[asyncio.Task[None]] = set()
+        for index, coordinator in enumerate(coordinators):
+            if index:
+                await asyncio.sleep(WARMUP_GAP)
+            while len(running) >= scheduler.limit:
+                _, running = await asyncio.wait(
+                    running, return_when=asyncio.FIRST_COMPLETED
+                )
+            # User writes go first; the warm-up resumes once they got a slot
+            while scheduler.has_waiter_before(OperationPriority.POLL):
+                await asyncio.sleep(WRITE_YIELD_INTERVAL)
+            address = coordinator.device.address
+            if self._pending.get(address) is not coordinator:
+                # Unloaded, or reloaded and warmed up with the next batch
+                continue
+            del self._pending[address]
+            running.add(
+                self.hass.async_create_background_task(
+                    self._async_refresh(coordinator),
+                    f"terma_moa_blue warm-up {address}",
+                )
+            )
+        if running:
+            await asyncio.wait(running)
+
+    async def _async_refresh(self, coordinator: TermaMoaBlueCoordinator) -> None:
+        """Run the first refresh of one device."""
+        started = time.monotonic()
+        await coordinator.async_refresh()
+        _LOGGER.debug(
+            "Warmed up %s in %.1fs (success: %s)",
+            coordinator.device.address,
+            time.monotonic() - started,
+            coordinator.last_update_success,
+        )
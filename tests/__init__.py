@@ -0,0 +1 @@
+"""Tests for the Terma MOA Blue integration."""
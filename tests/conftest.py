@@ -0,0 +1,65 @@
+"""Fixtures running TermaMoaBlueDevice against simulated radiators."""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from typing import Any
+
+import pytest
+
+from custom_components.terma_moa_blue import api
+from custom_components.terma_moa_blue.api import TermaMoaBlueDevice
+from custom_components.terma_moa_blue.const import DEFAULT_ADAPTER_CONCURRENCY
+from custom_components.terma_moa_blue.retry import RetryPolicy
+from custom_components.terma_moa_blue.scheduler import CONNECTION_SCHEDULER
+from tools.moa_simulator import SimulatedAdapter, SimulatedBondStore, SimulatedRadiator
+
+# Retries fast enough for tests, with the production attempt limit
+FAST_RETRY = RetryPolicy(connect_timeout=1.0, base_delay=0.01, max_delay=0.02, jitter=0)
+
+
+@pytest.fixture(autouse=True)
+def reset_connection_scheduler() -> Iterator[None]:
+    """Give every test fresh adapter schedulers and no idle sessions."""
+    CONNECTION_SCHEDULER._adapters.clear()
+    CONNECTION_SCHEDULER.set_limit(DEFAULT_ADAPTER_CONCURRENCY)
+    api._LINGERING.clear()
+    yield
+    CONNECTION_SCHEDULER._adapters.clear()
+    api._LINGERING.clear()
+
+
+@pytest.fixture
+def simulator(monkeypatch: pytest.MonkeyPatch) -> SimulatedAdapter:
+    """Return the simulated radiators, connected to instead of real ones."""
+    adapter = SimulatedAdapter(seed=1)
+    monkeypatch.setattr(api, "establish_connection", adapter.establish_connection)
+    return adapter
+
+
+@pytest.fixture
+def make_device(
+    simulator: SimulatedAdapter,
+) -> Callable[..., tuple[TermaMoaBlueDevice, SimulatedRadiator]]:
+    """Return a factory of devices, each with its own simulated radiator."""
+    bond_store = SimulatedBondStore()
+    count = 0
+
+    def _make(
+        radiator_options: dict[str, Any] | None = None, **device_options: Any
+    ) -> tuple[TermaMoaBlueDevice, SimulatedRadiator]:
+        nonlocal count
+        options = {"connect_latency": 0.01, "pair_latency": 0.0, "op_latency": 0.001}
+        options.update(radiator_options or {})
+        radiator = simulator.add(
+            SimulatedRadiator(address=f"AA:BB:CC:DD:EE:{count:02X}", **options)
+        )
+        count += 1
+        device_options.setdefault("session_linger", 0)
+        device_options.setdefault("write_debounce", 0)
+        device_options.setdefault("retry_policy", FAST_RETRY)
+        device = TermaMoaBlueDevice(
+            radiator.ble_device, bond_store=bond_store, **device_options
+        )
+        return device, radiator
+
+    return _make
@@ -0,0 +1,257 @@
+"""Tests for TermaMoaBlueDevice against simulated radiators."""
+from __future__ import annotations
+
+import asyncio
+import time
+
+from bleak.exc import BleakError
+import pytest
+
+from custom_components.terma_moa_blue.const import SHUTDOWN_TIMEOUT, OperatingMode
+from custom_components.terma_moa_blue.retry import CircuitBreaker, RetryPolicy
+from custom_components.terma_moa_blue.routing import ConnectionRouter
+from custom_components.terma_moa_blue.scheduler import CONNECTION_SCHEDULER
+from tools.moa_simulator import SimulatedScanner, SimulatedScannerRegistry
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_update_reads_state(make_device) -> None:
+    """A poll decodes all characteristics and makes the state fresh."""
+    device, radiator = make_device()
+    assert device.stale
+
+    snapshot = await device.update()
+    assert not snapshot.stale
+    assert snapshot.current_room_temp == radiator.current_room
+    assert snapshot.target_room_temp == radiator.target_room
+    assert snapshot.target_element_temp == radiator.target_element
+    assert snapshot.mode is radiator.mode
+
+
+async def test_write_skips_own_queued_poll(make_device) -> None:
+    """A write does not wait for the device lock behind its own queued poll."""
+    CONNECTION_SCHEDULER.set_limit(1)
+    devices = [make_device({"connect_latency": 0.05}) for _ in range(6)]
+    device, radiator = devices[0]
+    others = [asyncio.create_task(dev.update()) for dev, _ in devices[1:]]
+    own_poll = asyncio.create_task(device.update())
+    await asyncio.sleep(0.01)
+
+    await device.set_mode(OperatingMode.OFF)
+    # Only the poll holding the adapter slot ran before the write
+    assert sum(poll.done() for poll in others) == 1
+    assert radiator.mode is OperatingMode.OFF
+
+    # The skipped poll returns the state the write read back
+    snapshot = await own_poll
+    assert snapshot.mode is OperatingMode.OFF
+    await asyncio.gather(*others)
+
+
+async def test_no_op_write_costs_no_connection(make_device) -> None:
+    """Values matching the fresh observed state are not written."""
+    device, radiator = make_device()
+    await device.update()
+    connects = radiator.connects
+
+    await device.apply(
+        mode=radiator.mode,
+        room_temperature=radiator.target_room,
+        element_temperature=radiator.target_element,
+    )
+    assert radiator.connects == connects
+    assert device.writes_avoided == 3
+
+
+async def test_restored_state_does_not_skip_writes(make_device) -> None:
+    """Values restored from storage may be outdated and are written anyway."""
+    device, radiator = make_device()
+    device.restore_state({"mode": OperatingMode.ON, "target_room_temp": 22.0})
+    radiator.mode = OperatingMode.OFF
+
+    await device.apply(mode=OperatingMode.ON)
+    assert radiator.mode is OperatingMode.ON
+    assert radiator.writes == 1
+
+
+async def test_queued_write_superseded(make_device) -> None:
+    """A newer request takes over the fields of a write still queued."""
+    device, radiator = make_device()
+    await device.update()
+
+    first = asyncio.create_task(device.apply(room_temperature=19.0))
+    second = asyncio.create_task(
+        device.apply(room_temperature=20.0, element_temperature=45.0)
+    )
+    await asyncio.gather(first, second)
+
+    assert radiator.target_room == 20.0
+    assert radiator.target_element == 45.0
+    assert radiator.writes == 2
+    assert device.writes_superseded == 1
+
+
+async def test_superseded_no_op_drops_queued_write(make_device) -> None:
+    """Requesting the observed value again cancels a queued change."""
+    device, radiator = make_device({"mode": OperatingMode.ON})
+    await device.update()
+
+    first = asyncio.create_task(device.set_mode(OperatingMode.OFF))
+    second = asyncio.create_task(device.set_mode(OperatingMode.ON))
+    await asyncio.gather(first, second)
+
+    assert radiator.mode is OperatingMode.ON
+    assert radiator.writes == 0
+
+
+async def test_write_of_running_field_is_not_a_no_op(make_device) -> None:
+    """A value matching the state is written if a running write changes it."""
+    device, radiator = make_device(
+        {"mode": OperatingMode.ON, "connect_latency": 0.05}
+    )
+    await device.update()
+
+    first = asyncio.create_task(device.set_mode(OperatingMode.OFF))
+    while not radiator.writes:  # connected, writing
+        await asyncio.sleep(0.005)
+    await device.set_mode(OperatingMode.ON)
+    await first
+
+    assert radiator.mode is OperatingMode.ON
+    assert device.mode is OperatingMode.ON
+    assert radiator.writes == 2
+
+
+async def test_debounced_setpoints_merged(make_device) -> None:
+    """Setpoints within the debounce window are written in one session."""
+    device, radiator = make_device(write_debounce=0.05)
+    await device.update()
+    connects = radiator.connects
+
+    await asyncio.gather(
+        device.set_room_temperature(20.0),
+        device.set_room_temperature(20.5),
+        device.set_element_temperature(45.0),
+    )
+
+    assert radiator.target_room == 20.5
+    assert radiator.target_element == 45.0
+    assert radiator.connects == connects + 1
+    assert radiator.writes == 2
+    assert device.setpoint_writes_merged == 1
+
+
+async def test_debounced_setpoint_failure_reaches_every_caller(make_device) -> None:
+    """All callers waiting for a merged write see its failure."""
+    device, radiator = make_device(
+        {"failure_rate": 1.0},
+        write_debounce=0.01,
+        retry_policy=RetryPolicy(max_attempts=1),
+    )
+
+    results = await asyncio.gather(
+        device.set_room_temperature(20.0),
+        device.set_element_temperature(45.0),
+        return_exceptions=True,
+    )
+    assert all(isinstance(result, BleakError) for result in results)
+
+
+async def test_shutdown_cancels_queued_and_running_operations(make_device) -> None:
+    """Unloading does not wait for a radiator that takes long to connect."""
+    device, radiator = make_device(
+        {"connect_latency": 30.0},
+        retry_policy=RetryPolicy(connect_timeout=60.0),
+        write_debounce=1.0,
+    )
+    running = asyncio.create_task(device.update())
+    queued = asyncio.create_task(device.set_mode(OperatingMode.OFF))
+    debounced = asyncio.create_task(device.set_room_temperature(20.0))
+    await asyncio.sleep(0.01)
+
+    started = time.monotonic()
+    await device.shutdown()
+    assert time.monotonic() - started < SHUTDOWN_TIMEOUT
+
+    for operation in (running, queued, debounced):
+        with pytest.raises(BleakError):
+            await operation
+    assert not device._lock.locked()
+    assert CONNECTION_SCHEDULER.for_source(radiator.source).active == 0
+    with pytest.raises(BleakError, match="shut down"):
+        await device.update()
+
+
+async def test_circuit_breaker_fails_fast(make_device) -> None:
+    """An open circuit refuses operations without connecting."""
+    device, radiator = make_device(
+        {"failure_rate": 1.0}, retry_policy=RetryPolicy(max_attempts=2, base_delay=0)
+    )
+    device.circuit_breaker = CircuitBreaker(failure_threshold=1, cooldown=60)
+
+    with pytest.raises(BleakError, match="after 2 attempts"):
+        await device.update()
+    connects = radiator.connects
+    with pytest.raises(BleakError, match="failed repeatedly"):
+        await device.update()
+    assert radiator.connects == connects
+
+
+async def test_half_open_circuit_runs_one_trial(make_device) -> None:
+    """After the cool-down one operation tries; the others are refused."""
+    device, radiator = make_device(
+        {"failure_rate": 1.0}, retry_policy=RetryPolicy(max_attempts=1)
+    )
+    device.circuit_breaker = CircuitBreaker(failure_threshold=1, cooldown=0)
+    with pytest.raises(BleakError):
+        await device.update()
+    connects = radiator.connects
+
+    results = await asyncio.gather(
+        *(device.update() for _ in range(3)), return_exceptions=True
+    )
+    assert radiator.connects == connects + 1
+    assert sum("waiting for a trial" in str(result) for result in results) == 2
+
+    # The radiator is back - the next trial closes the circuit
+    radiator.failure_rate = 0.0
+    await device.update()
+    await asyncio.gather(*(device.update(force=True) for _ in range(3)))
+
+
+async def test_router_falls_back_to_next_adapter(simulator, make_device) -> None:
+    """A path without a free connection slot falls back to the next one."""
+    # hci0 has the best signal, but its slots are taken and it does not say so
+    busy = simulator.add_scanner(
+        SimulatedScanner("hci0", slots=1, allocated=1, report_slots=False)
+    )
+    spare = simulator.add_scanner(SimulatedScanner("hci1", slots=1))
+    router = ConnectionRouter(SimulatedScannerRegistry(simulator))
+    device, radiator = make_device(
+        retry_policy=RetryPolicy(connect_timeout=0.05), router=router
+    )
+    busy.rssi[radiator.address] = -50
+    spare.rssi[radiator.address] = -80
+
+    await device.update()
+    assert not device.stale
+    assert device.metrics.attempts.max == 2
+    assert CONNECTION_SCHEDULER.for_source("hci0").active == 0
+    assert CONNECTION_SCHEDULER.for_source("hci1").active == 0
+
+    # The working path is preferred from now on
+    assert router.plan(radiator.address)[0].source == "hci1"
+    await device.update(force=True)
+    assert device.metrics.attempts.count == 2
+    assert device.metrics.attempts.p50 == 1
+
+
+async def test_session_reused_within_linger(make_device) -> None:
+    """Operations within the idle window share one connection."""
+    device, radiator = make_device(session_linger=1.0)
+    await device.update()
+    await device.set_mode(OperatingMode.OFF)
+    await device.update(force=True)
+    assert radiator.connects == 1
+    await device.shutdown()
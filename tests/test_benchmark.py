@@ -0,0 +1,122 @@
+"""Latency benchmarks of TermaMoaBlueDevice operations on simulated radiators.
+
+The rows of tools/benchmark.py as pytest-benchmark tests, compared across
+runs with ``pytest tests/test_benchmark.py --benchmark-autosave`` and
+``--benchmark-compare``. Each benchmark also checks that its operation did
+what it is timed for.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterator
+import itertools
+
+import pytest
+
+from custom_components.terma_moa_blue.const import OperatingMode
+
+ROUNDS = 20
+
+
+@pytest.fixture
+def loop() -> Iterator[asyncio.AbstractEventLoop]:
+    """Return an event loop the benchmarked operations run on."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture
+def run(
+    benchmark, loop: asyncio.AbstractEventLoop
+) -> Callable[[Callable[[], Awaitable[object]]], int]:
+    """Return a runner timing one operation per round; returns the rounds run."""
+
+    def _run(op: Callable[[], Awaitable[object]]) -> int:
+        rounds = 0
+
+        def _round() -> None:
+            nonlocal rounds
+            rounds += 1
+            loop.run_until_complete(op())
+
+        # Runs once with --benchmark-disable
+        benchmark.pedantic(_round, rounds=ROUNDS, iterations=1)
+        return rounds
+
+    return _run
+
+
+@pytest.fixture
+def device(make_device, loop: asyncio.AbstractEventLoop):
+    """Return a device whose state has been read once."""
+    device, radiator = make_device()
+    loop.run_until_complete(device.update())
+    return device, radiator
+
+
+def test_update(run, device) -> None:
+    """Poll reading every characteristic."""
+    device, radiator = device
+    rounds = run(lambda: device.update(force=True))
+    assert radiator.reads == 3 * (rounds + 1)
+
+
+def test_update_planned(run, device) -> None:
+    """Poll reading only the characteristics due for a read."""
+    device, radiator = device
+    run(device.update)
+    assert device.reads_skipped > 0
+
+
+def test_set_room_temperature(run, device) -> None:
+    """Room setpoint write; alternating, or all but the first are no-ops."""
+    device, radiator = device
+    rooms = itertools.cycle((22.5, 23.0))
+    rounds = run(lambda: device.set_room_temperature(next(rooms)))
+    assert radiator.writes == rounds
+
+
+def test_set_element_temperature(run, device) -> None:
+    """Element setpoint write."""
+    device, radiator = device
+    elements = itertools.cycle((55.0, 50.0))
+    rounds = run(lambda: device.set_element_temperature(next(elements)))
+    assert radiator.writes == rounds
+
+
+def test_set_mode(run, device) -> None:
+    """Mode write."""
+    device, radiator = device
+    modes = itertools.cycle((OperatingMode.OFF, OperatingMode.ON))
+    rounds = run(lambda: device.set_mode(next(modes)))
+    assert radiator.writes == rounds
+
+
+def test_apply(run, device) -> None:
+    """Mode and both setpoints in one session."""
+    device, radiator = device
+    modes = itertools.cycle((OperatingMode.OFF, OperatingMode.ON))
+    rooms = itertools.cycle((22.5, 23.0))
+    elements = itertools.cycle((55.0, 45.0))
+    rounds = run(lambda: device.apply(next(modes), next(rooms), next(elements)))
+    assert radiator.writes == 3 * rounds
+
+
+def test_apply_no_op(run, device) -> None:
+    """Request matching the observed state, skipped without a connection."""
+    device, radiator = device
+    connects = radiator.connects
+    run(lambda: device.apply(device.mode, device.target_room_temp))
+    assert radiator.connects == connects
+
+
+def test_poll_sweep(run, make_device) -> None:
+    """Poll of eight radiators sharing one adapter."""
+    devices = [make_device()[0] for _ in range(8)]
+
+    async def sweep() -> None:
+        await asyncio.gather(*(device.update(force=True) for device in devices))
+
+    run(sweep)
+    assert not any(device.stale for device in devices)
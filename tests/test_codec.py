@@ -0,0 +1,81 @@
+"""Tests for the MOA Blue characteristic codec."""
+from __future__ import annotations
+
+import struct
+
+import pytest
+
+from custom_components.terma_moa_blue.codec import (
+    ElementTemperatureFrame,
+    FrameError,
+    ModeFrame,
+    RoomTemperatureFrame,
+    TemperatureFrame,
+    raw_temperature,
+)
+from custom_components.terma_moa_blue.const import (
+    MAX_ELEMENT_TEMP,
+    MIN_ROOM_TEMP,
+    OperatingMode,
+)
+
+# Every temperature of both characteristics, in the protocol's 0.1°C units
+RAW_TEMPERATURES = range(MIN_ROOM_TEMP * 10, MAX_ELEMENT_TEMP * 10 + 1)
+FRAME_TYPES = (RoomTemperatureFrame, ElementTemperatureFrame)
+
+
+@pytest.mark.parametrize("frame_type", FRAME_TYPES)
+def test_encode_setpoint_layout(frame_type: type[TemperatureFrame]) -> None:
+    """Setpoints are sent as the mobile app sends them."""
+    for raw in RAW_TEMPERATURES:
+        data = frame_type.encode_setpoint(raw / 10)
+        assert data == bytes([0, 0]) + struct.pack("<H", raw), raw
+
+
+@pytest.mark.parametrize("frame_type", FRAME_TYPES)
+def test_decode_round_trip(frame_type: type[TemperatureFrame]) -> None:
+    """Decoded temperatures match what was encoded, at 0.1°C resolution."""
+    for raw in RAW_TEMPERATURES:
+        temperature = raw / 10
+        frame = frame_type.decode(bytearray(struct.pack("<HH", raw, raw)))
+        assert frame == frame_type(temperature, temperature), raw
+        assert raw_temperature(frame.target) == raw
+
+
+@pytest.mark.parametrize("frame_type", FRAME_TYPES)
+def test_decode_memoryview(frame_type: type[TemperatureFrame]) -> None:
+    """Frames decode from a slice of a larger buffer as well."""
+    view = memoryview(bytes(2) + struct.pack("<HH", 215, 220))[2:]
+    assert frame_type.decode(view) == frame_type(21.5, 22.0)
+
+
+@pytest.mark.parametrize("mode", list(OperatingMode))
+def test_mode_round_trip(mode: OperatingMode) -> None:
+    """Every mode encodes to its value byte and decodes back."""
+    data = ModeFrame.encode(mode)
+    assert data == bytes([mode, 0, 0, 0])
+    assert ModeFrame.decode(data).mode is mode
+    # Only the first byte carries the mode
+    assert ModeFrame.decode(data[:1]).mode is mode
+
+
+def test_unknown_mode() -> None:
+    """An unknown mode value decodes to no mode."""
+    assert ModeFrame.decode(b"\xff").mode is None
+
+
+@pytest.mark.parametrize("data", [b"", b"\x00\x01\x02", b"\x00\x01\x02\x03\x04"])
+@pytest.mark.parametrize("frame_type", FRAME_TYPES)
+def test_temperature_frame_length(
+    frame_type: type[TemperatureFrame], data: bytes
+) -> None:
+    """Temperature frames must be four bytes."""
+    with pytest.raises(FrameError):
+        frame_type.decode(data)
+
+
+@pytest.mark.parametrize("data", [b"", b"\x21\x00\x00\x00\x00"])
+def test_mode_frame_length(data: bytes) -> None:
+    """Mode frames must be one to four bytes."""
+    with pytest.raises(FrameError):
+        ModeFrame.decode(data)
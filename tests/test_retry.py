@@ -0,0 +1,91 @@
+"""Tests for the per-device circuit breaker."""
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.terma_moa_blue import retry
+from custom_components.terma_moa_blue.retry import CircuitBreaker, CircuitState
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Replace the breaker's clock with one moved by hand."""
+    clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(
+        retry, "time", SimpleNamespace(monotonic=lambda: clock.now)
+    )
+    return clock
+
+
+def _opened(clock: SimpleNamespace) -> CircuitBreaker:
+    """Return a breaker opened by failures and past its cool-down."""
+    breaker = CircuitBreaker(failure_threshold=3, cooldown=60)
+    for _ in range(3):
+        assert breaker.allow()
+        breaker.record_failure()
+    clock.now += 60
+    return breaker
+
+
+def test_opens_after_failure_threshold(clock: SimpleNamespace) -> None:
+    """Operations are refused once the threshold of failures is reached."""
+    breaker = CircuitBreaker(failure_threshold=3, cooldown=60)
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state is CircuitState.CLOSED
+    breaker.record_failure()
+    assert breaker.state is CircuitState.OPEN
+    assert not breaker.allow()
+    assert breaker.retry_in == 60
+
+    clock.now += 59
+    assert not breaker.allow()
+
+
+def test_success_resets_failure_count(clock: SimpleNamespace) -> None:
+    """Only failures in a row open the circuit."""
+    breaker = CircuitBreaker(failure_threshold=2, cooldown=60)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_half_open_lets_one_trial_through(clock: SimpleNamespace) -> None:
+    """After the cool-down only one operation may run until it is done."""
+    breaker = _opened(clock)
+    assert breaker.state is CircuitState.HALF_OPEN
+    assert breaker.allow()
+    assert breaker.trial_running
+    assert not breaker.allow()
+    assert not breaker.allow()
+
+    breaker.record_success()
+    assert breaker.state is CircuitState.CLOSED
+    assert not breaker.trial_running
+    assert breaker.allow()
+    assert breaker.allow()
+
+
+def test_failed_trial_reopens(clock: SimpleNamespace) -> None:
+    """A failed trial starts another cool-down."""
+    breaker = _opened(clock)
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state is CircuitState.OPEN
+    assert not breaker.allow()
+
+    clock.now += 60
+    assert breaker.allow()
+
+
+def test_abandoned_trial_lets_next_operation_try(clock: SimpleNamespace) -> None:
+    """A trial ending without an outcome, e.g. cancelled, frees the trial."""
+    breaker = _opened(clock)
+    assert breaker.allow()
+    breaker.end_trial()
+    assert breaker.state is CircuitState.HALF_OPEN
+    assert breaker.allow()
+    assert not breaker.allow()
@@ -0,0 +1,97 @@
+"""Tests for the per-adapter connection scheduler."""
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from custom_components.terma_moa_blue.const import OperationPriority
+from custom_components.terma_moa_blue.scheduler import AdapterScheduler
+
+
+@pytest.mark.asyncio
+async def test_slots_granted_by_priority_then_fifo() -> None:
+    """Queued operations get the slot most urgent first, oldest first."""
+    scheduler = AdapterScheduler("hci0", 1)
+    await scheduler.acquire()
+    order: list[tuple[OperationPriority, int]] = []
+
+    async def queue(priority: OperationPriority, index: int) -> None:
+        await scheduler.acquire(priority)
+        order.append((priority, index))
+        scheduler.release()
+
+    queued = [
+        asyncio.create_task(queue(priority, index))
+        for index, priority in enumerate(
+            (
+                OperationPriority.POLL,
+                OperationPriority.VERIFY,
+                OperationPriority.POLL,
+                OperationPriority.INTERACTIVE,
+            )
+        )
+    ]
+    await asyncio.sleep(0)
+    assert scheduler.waiting == 4
+
+    scheduler.release()
+    await asyncio.gather(*queued)
+    assert order == [
+        (OperationPriority.INTERACTIVE, 3),
+        (OperationPriority.VERIFY, 1),
+        (OperationPriority.POLL, 0),
+        (OperationPriority.POLL, 2),
+    ]
+    assert scheduler.active == 0
+
+
+@pytest.mark.asyncio
+async def test_pause_lends_slot_to_more_urgent_operation() -> None:
+    """A retry back-off lets a queued write run, then takes the slot back."""
+    scheduler = AdapterScheduler("hci0", 1)
+    poll_held: list[bool] = []
+
+    async def write() -> None:
+        await scheduler.acquire(OperationPriority.INTERACTIVE)
+        poll_held.append(slot.held)
+        scheduler.release()
+
+    async with scheduler.slot(OperationPriority.POLL) as slot:
+        queued = asyncio.create_task(write())
+        await asyncio.sleep(0)
+        assert scheduler.has_waiter_before(OperationPriority.POLL)
+        await slot.pause(0.01)
+        assert slot.held
+        await queued
+
+    assert poll_held == [False]
+    assert scheduler.active == 0
+
+
+@pytest.mark.asyncio
+async def test_pause_keeps_slot_without_more_urgent_operation() -> None:
+    """Equally urgent operations wait until the pausing one is done."""
+    scheduler = AdapterScheduler("hci0", 1)
+    async with scheduler.slot(OperationPriority.POLL) as slot:
+        queued = asyncio.create_task(scheduler.acquire(OperationPriority.POLL))
+        await asyncio.sleep(0)
+        await slot.pause(0.01)
+        assert not queued.done()
+    await queued
+    scheduler.release()
+    assert scheduler.active == 0
+
+
+@pytest.mark.asyncio
+async def test_raised_limit_wakes_queued_operations() -> None:
+    """Raising the concurrency limit grants the new slots right away."""
+    scheduler = AdapterScheduler("hci0", 1)
+    await scheduler.acquire()
+    queued = asyncio.create_task(scheduler.acquire())
+    await asyncio.sleep(0)
+    assert not queued.done()
+
+    scheduler.set_limit(2)
+    await queued
+    assert scheduler.active == 2
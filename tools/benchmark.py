@@ -0,0 +1,206 @@
+"""Benchmark TermaMoaBlueDevice against simulated MOA Blue radiators.
+
+Run from the repository root in an environment with the integration's
+requirements (Home Assistant, bleak, bleak-retry-connector) installed:
+
+    python -m tools.benchmark --radiators 8 --adapters 2
+
+Reports p50/p95/max latency per operation and the wall time of poll sweeps
+over all radiators, for regression tracking of throughput and tail latency.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Awaitable, Callable
+import itertools
+import time
+
+from bleak.exc import BleakError
+
+from custom_components.terma_moa_blue import api
+from custom_components.terma_moa_blue.api import TermaMoaBlueDevice
+from custom_components.terma_moa_blue.const import OperatingMode
+from custom_components.terma_moa_blue.metrics import RollingHistogram
+from custom_components.terma_moa_blue.retry import RetryPolicy
+from custom_components.terma_moa_blue.routing import ConnectionRouter
+from custom_components.terma_moa_blue.scheduler import CONNECTION_SCHEDULER
+
+from .moa_simulator import (
+    SimulatedAdapter,
+    SimulatedBondStore,
+    SimulatedRadiator,
+    SimulatedScanner,
+    SimulatedScannerRegistry,
+)
+
+
+def _report(
+    name: str, histogram: RollingHistogram, wall: float, failures: int
+) -> None:
+    """Print one result row."""
+    print(
+        f"{name:<28} {histogram.count:>6} "
+        f"{histogram.p50 * 1000:>9.1f} {histogram.p95 * 1000:>9.1f} "
+        f"{histogram.max * 1000:>9.1f} {histogram.count / wall:>9.1f} {failures:>6}"
+    )
+
+
+async def _measure(
+    name: str, iterations: int, op: Callable[[], Awaitable[None]]
+) -> RollingHistogram:
+    """Run op iterations times and report its latency."""
+    histogram = RollingHistogram(size=iterations)
+    failures = 0
+    started = time.monotonic()
+    for _ in range(iterations):
+        with histogram.time():
+            try:
+                await op()
+            except BleakError:
+                failures += 1
+    _report(name, histogram, time.monotonic() - started, failures)
+    return histogram
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Run all benchmarks."""
+    adapter = SimulatedAdapter(seed=args.seed)
+    api.establish_connection = adapter.establish_connection
+    bond_store = SimulatedBondStore()
+    router = (
+        ConnectionRouter(SimulatedScannerRegistry(adapter)) if args.routing else None
+    )
+    if args.slots:
+        for index in range(args.adapters):
+            scanner = adapter.add_scanner(
+                SimulatedScanner(source=f"hci{index}", slots=args.slots)
+            )
+            if index == 0:
+                # Slots taken by other devices' connections
+                scanner.allocated = min(args.occupied, args.slots)
+
+    CONNECTION_SCHEDULER.set_limit(args.concurrency)
+    devices: list[TermaMoaBlueDevice] = []
+    for index in range(args.radiators):
+        radiator = adapter.add(
+            SimulatedRadiator(
+                address=f"AA:BB:CC:DD:{index // 256:02X}:{index % 256:02X}",
+                source=f"hci{index % args.adapters}",
+                connect_latency=args.connect_latency,
+                pair_latency=args.pair_latency,
+                op_latency=args.op_latency,
+                failure_rate=args.failure_rate,
+                pipelining=not args.serial_gatt,
+            )
+        )
+        for source, scanner in adapter.scanners.items():
+            # Strongest signal via hci0, the scanner with occupied slots
+            scanner.rssi[radiator.address] = -60 - 5 * int(source[3:])
+        devices.append(
+            TermaMoaBlueDevice(
+                radiator.ble_device,
+                session_linger=args.linger,
+                bond_store=bond_store,
+                write_debounce=args.debounce,
+                pipeline_reads=args.pipeline_reads,
+                retry_policy=RetryPolicy(connect_timeout=args.connect_timeout),
+                router=router,
+            )
+        )
+
+    device = devices[0]
+    print(
+        f"{'benchmark':<28} {'n':>6} {'p50 ms':>9} {'p95 ms':>9} "
+        f"{'max ms':>9} {'ops/s':>9} {'failed':>6}"
+    )
+    await _measure("update", args.iterations, lambda: device.update(force=True))
+    await _measure("update[planned]", args.iterations, device.update)
+    # Alternate the values, or every write after the first would be skipped
+    # as a no-op; apply[no-op] measures that skip on its own
+    rooms = itertools.cycle((22.5, 23.0))
+    elements = itertools.cycle((55, 50))
+    modes = itertools.cycle((OperatingMode.OFF, OperatingMode.ON))
+    await _measure(
+        "set_room_temperature",
+        args.iterations,
+        lambda: device.set_room_temperature(next(rooms)),
+    )
+    await _measure(
+        "set_element_temperature",
+        args.iterations,
+        lambda: device.set_element_temperature(next(elements)),
+    )
+    await _measure(
+        "set_mode", args.iterations, lambda: device.set_mode(next(modes))
+    )
+    await _measure(
+        "apply",
+        args.iterations,
+        lambda: device.apply(next(modes), next(rooms), next(elements)),
+    )
+    await _measure(
+        "apply[no-op]",
+        args.iterations,
+        lambda: device.apply(device.mode, device.target_room_temp),
+    )
+
+    async def sweep() -> None:
+        await asyncio.gather(*(dev.update(force=True) for dev in devices))
+
+    await _measure(
+        f"poll_sweep[{args.radiators}x/{args.adapters}a]", args.sweeps, sweep
+    )
+
+    for dev in devices:
+        await dev.disconnect()
+
+
+def main() -> None:
+    """Parse arguments and run the benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--radiators", type=int, default=8)
+    parser.add_argument("--adapters", type=int, default=1)
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--sweeps", type=int, default=10)
+    parser.add_argument("--connect-latency", type=float, default=0.05)
+    parser.add_argument("--pair-latency", type=float, default=0.02)
+    parser.add_argument("--op-latency", type=float, default=0.01)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--linger", type=float, default=0.0)
+    parser.add_argument("--debounce", type=float, default=0.0)
+    parser.add_argument(
+        "--serial-gatt",
+        action="store_true",
+        help="simulate a backend that cannot overlap GATT operations",
+    )
+    parser.add_argument(
+        "--pipeline-reads",
+        action="store_true",
+        help="issue the reads of a poll concurrently on one connection",
+    )
+    parser.add_argument("--connect-timeout", type=float, default=20.0)
+    parser.add_argument(
+        "--slots",
+        type=int,
+        default=0,
+        help="connection slots per adapter, reaching every radiator (0: unlimited)",
+    )
+    parser.add_argument(
+        "--occupied",
+        type=int,
+        default=0,
+        help="slots of hci0 taken by other devices (with --slots)",
+    )
+    parser.add_argument(
+        "--routing",
+        action="store_true",
+        help="choose adapters by free slots and RSSI (with --slots)",
+    )
+    parser.add_argument("--seed", type=int, default=1)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Micro-benchmark the Terma MOA Blue characteristic codec.
+
+Run from the repository root:
+
+    python -m tools.codec_benchmark --number 200000
+
+Times decoding and encoding against the slice-and-unpack code the codec
+replaced. The codec's round-trips and length checks are tested in
+tests/test_codec.py.
+"""
+from __future__ import annotations
+
+import argparse
+import struct
+import timeit
+
+from custom_components.terma_moa_blue.codec import (
+    ElementTemperatureFrame,
+    ModeFrame,
+    RoomTemperatureFrame,
+)
+from custom_components.terma_moa_blue.const import MAX_ROOM_TEMP, OperatingMode
+
+
+def _legacy_decode(data: bytearray) -> tuple[float, float]:
+    """Decode a temperature value the way api.py did before the codec."""
+    current = struct.unpack("<H", data[0:2])[0] / 10.0
+    target = struct.unpack("<H", data[2:4])[0] / 10.0
+    return current, target
+
+
+def _legacy_decode_mode(data: bytearray) -> OperatingMode | None:
+    """Decode a mode value the way api.py did before the codec."""
+    try:
+        return OperatingMode(data[0])
+    except ValueError:
+        return None
+
+
+def _legacy_encode(temperature: float) -> bytes:
+    """Encode a setpoint the way api.py did before the codec."""
+    return bytes([0x00, 0x00]) + struct.pack("<H", round(temperature * 10))
+
+
+def main() -> None:
+    """Parse arguments and run the timings."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=200000)
+    args = parser.parse_args()
+
+    data = bytearray(struct.pack("<HH", 215, MAX_ROOM_TEMP * 10))
+    mode = bytearray(ModeFrame.encode(OperatingMode.ON))
+    timings = {
+        "decode temperature (legacy)": lambda: _legacy_decode(data),
+        "decode temperature (codec)": lambda: RoomTemperatureFrame.decode(data),
+        "decode mode (legacy)": lambda: _legacy_decode_mode(mode),
+        "decode mode (codec)": lambda: ModeFrame.decode(mode).mode,
+        "encode setpoint (legacy)": lambda: _legacy_encode(55.0),
+        "encode setpoint (codec)": lambda: (
+            ElementTemperatureFrame.encode_setpoint(55.0)
+        ),
+    }
+    print(f"{'operation':<30} {'ns/op':>8}")
+    for name, op in timings.items():
+        seconds = min(timeit.repeat(op, number=args.number, repeat=5))
+        print(f"{name:<30} {seconds / args.number * 1e9:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
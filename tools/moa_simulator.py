@@ -0,0 +1,303 @@
+"""Simulated Terma MOA Blue GATT peripheral for benchmarking api.py.
+
+Stands in for BleakClient and bleak_retry_connector.establish_connection,
+serving the three MOA Blue characteristics with their real byte layouts:
+
+- room / element temperature: ``<H current, <H target`` (value x 10)
+- mode: ``[mode, 0x00, 0x00, 0x00]``
+
+Connect, pair and per-operation latency as well as failure injection are
+configurable per radiator, so TermaMoaBlueDevice can be exercised without
+real hardware. Optional scanners with limited connection slots and
+per-radiator RSSI, reported through SimulatedScannerRegistry, exercise the
+routing across adapters and proxies.
+"""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+import random
+import struct
+from typing import Any
+
+from bleak.exc import BleakError
+
+from custom_components.terma_moa_blue.const import (
+    CHAR_ELEMENT_TEMP,
+    CHAR_MODE,
+    CHAR_ROOM_TEMP,
+    OperatingMode,
+)
+from custom_components.terma_moa_blue.routing import ConnectionPath
+
+HANDLES = {CHAR_ROOM_TEMP: 0x0B, CHAR_ELEMENT_TEMP: 0x0E, CHAR_MODE: 0x11}
+
+
+@dataclass
+class SimulatedBLEDevice:
+    """Minimal BLEDevice stand-in (address, name, details)."""
+
+    address: str
+    name: str
+    details: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class SimulatedRadiator:
+    """State and link behaviour of one simulated radiator."""
+
+    address: str
+    source: str = "hci0"
+    current_room: float = 21.5
+    target_room: float = 22.0
+    current_element: float = 35.0
+    target_element: float = 50.0
+    mode: OperatingMode = OperatingMode.ON
+    connect_latency: float = 0.05
+    pair_latency: float = 0.02
+    op_latency: float = 0.01
+    failure_rate: float = 0.0  # probability of a failed connect
+    pipelining: bool = True  # backend can overlap GATT operations, else rejects them
+    connects: int = 0
+    pairs: int = 0
+    reads: int = 0
+    writes: int = 0
+
+    @property
+    def ble_device(self) -> SimulatedBLEDevice:
+        """Return a BLEDevice for the radiator."""
+        return SimulatedBLEDevice(
+            self.address, f"MOA Blue {self.address[-5:]}", {"source": self.source}
+        )
+
+    def read(self, uuid: str) -> bytearray:
+        """Return the characteristic value."""
+        if uuid == CHAR_ROOM_TEMP:
+            return bytearray(
+                struct.pack(
+                    "<HH", int(self.current_room * 10), int(self.target_room * 10)
+                )
+            )
+        if uuid == CHAR_ELEMENT_TEMP:
+            return bytearray(
+                struct.pack(
+                    "<HH",
+                    int(self.current_element * 10),
+                    int(self.target_element * 10),
+                )
+            )
+        return bytearray([self.mode.value, 0x00, 0x00, 0x00])
+
+    def write(self, uuid: str, data: bytes) -> None:
+        """Apply a written characteristic value."""
+        if len(data) != 4:
+            raise BleakError(f"Invalid length {len(data)} for {uuid}")
+        if uuid == CHAR_ROOM_TEMP:
+            self.target_room = struct.unpack_from("<H", data, 2)[0] / 10.0
+        elif uuid == CHAR_ELEMENT_TEMP:
+            self.target_element = struct.unpack_from("<H", data, 2)[0] / 10.0
+        else:
+            self.mode = OperatingMode(data[0])
+
+
+@dataclass
+class SimulatedCharacteristic:
+    """GATT characteristic with uuid and handle."""
+
+    uuid: str
+    handle: int
+
+
+class SimulatedServices:
+    """GATT service collection of a simulated radiator."""
+
+    def __init__(self) -> None:
+        """Initialize the collection."""
+        self._chars = [SimulatedCharacteristic(u, h) for u, h in HANDLES.items()]
+
+    def get_characteristic(self, specifier: int | str) -> SimulatedCharacteristic | None:
+        """Look up a characteristic by handle or UUID."""
+        for char in self._chars:
+            if specifier in (char.handle, char.uuid):
+                return char
+        return None
+
+
+class SimulatedClient:
+    """BleakClient stand-in connected to a simulated radiator."""
+
+    def __init__(
+        self, radiator: SimulatedRadiator, scanner: SimulatedScanner | None = None
+    ) -> None:
+        """Initialize the client."""
+        self._radiator = radiator
+        self._scanner = scanner
+        self._busy = False
+        self.services = SimulatedServices()
+        self.is_connected = True
+
+    def _uuid(self, char: int | str | SimulatedCharacteristic) -> str:
+        """Resolve a characteristic specifier to its UUID."""
+        if isinstance(char, SimulatedCharacteristic):
+            return char.uuid
+        if (found := self.services.get_characteristic(char)) is None:
+            raise BleakError(f"Characteristic {char} was not found")
+        return found.uuid
+
+    async def _op(self) -> None:
+        """Spend one GATT round-trip."""
+        if not self.is_connected:
+            raise BleakError("Not connected")
+        if self._radiator.pipelining:
+            await asyncio.sleep(self._radiator.op_latency)
+            return
+        # Like BlueZ, a backend without pipelining rejects overlapping requests
+        if self._busy:
+            raise BleakError("org.bluez.Error.InProgress: Operation already in progress")
+        self._busy = True
+        try:
+            await asyncio.sleep(self._radiator.op_latency)
+        finally:
+            self._busy = False
+
+    async def pair(self) -> bool:
+        """Pair with the radiator."""
+        self._radiator.pairs += 1
+        await asyncio.sleep(self._radiator.pair_latency)
+        return True
+
+    async def read_gatt_char(self, char: int | str | SimulatedCharacteristic) -> bytearray:
+        """Read a characteristic."""
+        uuid = self._uuid(char)
+        await self._op()
+        self._radiator.reads += 1
+        return self._radiator.read(uuid)
+
+    async def write_gatt_char(
+        self, char: int | str | SimulatedCharacteristic, data: bytes, response: bool | None = None
+    ) -> None:
+        """Write a characteristic."""
+        uuid = self._uuid(char)
+        await self._op()
+        self._radiator.writes += 1
+        self._radiator.write(uuid, bytes(data))
+
+    async def disconnect(self) -> bool:
+        """Disconnect, freeing the scanner's connection slot."""
+        if self.is_connected and self._scanner is not None:
+            self._scanner.allocated -= 1
+        self.is_connected = False
+        return True
+
+    async def clear_cache(self) -> bool:
+        """Clear the (simulated) GATT cache."""
+        return True
+
+
+class SimulatedBondStore:
+    """In-memory stand-in for TermaMoaBlueBondStore."""
+
+    def __init__(self) -> None:
+        """Initialize the store."""
+        self._bonded: set[str] = set()
+
+    def is_bonded(self, address: str) -> bool:
+        """Return True if the address is bonded."""
+        return address in self._bonded
+
+    def async_set_bonded(self, address: str, bonded: bool) -> None:
+        """Record the bond state of an address."""
+        if bonded:
+            self._bonded.add(address)
+        else:
+            self._bonded.discard(address)
+
+
+@dataclass
+class SimulatedScanner:
+    """Adapter or proxy with limited connection slots.
+
+    Connections through a scanner without a free slot hang until the
+    connect timeout, like a proxy that has run out of slots.
+    """
+
+    source: str
+    slots: int = 3
+    allocated: int = 0
+    report_slots: bool = True  # False for scanners not reporting allocations
+    rssi: dict[str, int] = field(default_factory=dict)  # reachable addresses
+
+
+class SimulatedAdapter:
+    """Registry of simulated radiators with an establish_connection stand-in."""
+
+    def __init__(self, seed: int | None = None) -> None:
+        """Initialize the registry."""
+        self.radiators: dict[str, SimulatedRadiator] = {}
+        self.scanners: dict[str, SimulatedScanner] = {}
+        self._random = random.Random(seed)
+
+    def add(self, radiator: SimulatedRadiator) -> SimulatedRadiator:
+        """Register a radiator."""
+        self.radiators[radiator.address] = radiator
+        return radiator
+
+    def add_scanner(self, scanner: SimulatedScanner) -> SimulatedScanner:
+        """Register a scanner; without any, every source reaches every radiator."""
+        self.scanners[scanner.source] = scanner
+        return scanner
+
+    async def establish_connection(
+        self,
+        client_class: type,
+        device: SimulatedBLEDevice,
+        name: str,
+        *args: Any,
+        timeout: float = 20.0,
+        **kwargs: Any,
+    ) -> SimulatedClient:
+        """Connect to a simulated radiator, like bleak_retry_connector does."""
+        radiator = self.radiators[device.address]
+        scanner = self.scanners.get(device.details.get("source", ""))
+        if self.scanners and (scanner is None or device.address not in scanner.rssi):
+            raise BleakError(f"{name}: not reachable via {device.details}")
+        if scanner is not None and scanner.allocated >= scanner.slots:
+            await asyncio.sleep(timeout)
+            raise TimeoutError(f"{name}: no free connection slot on {scanner.source}")
+        radiator.connects += 1
+        if self._random.random() < radiator.failure_rate:
+            await asyncio.sleep(min(timeout, radiator.connect_latency * 4))
+            raise BleakError(f"{name}: simulated connection failure")
+        if radiator.connect_latency > timeout:
+            await asyncio.sleep(timeout)
+            raise TimeoutError(f"{name}: simulated connect timeout")
+        await asyncio.sleep(radiator.connect_latency)
+        if scanner is not None:
+            scanner.allocated += 1
+        return SimulatedClient(radiator, scanner)
+
+
+class SimulatedScannerRegistry:
+    """Scanner registry reporting the simulated scanners' slots and RSSI."""
+
+    def __init__(self, adapter: SimulatedAdapter) -> None:
+        """Initialize the registry."""
+        self._adapter = adapter
+
+    def paths(self, address: str) -> list[ConnectionPath]:
+        """Return the connectable paths to an address."""
+        radiator = self._adapter.radiators[address]
+        return [
+            ConnectionPath(
+                source=scanner.source,
+                ble_device=SimulatedBLEDevice(
+                    address, radiator.ble_device.name, {"source": scanner.source}
+                ),
+                rssi=scanner.rssi[address],
+                free_slots=(
+                    scanner.slots - scanner.allocated if scanner.report_slots else None
+                ),
+            )
+            for scanner in self._adapter.scanners.values()
+            if address in scanner.rssi
+        ]